@@ -10,6 +10,7 @@ import tempfile
 import wave
 import subprocess
 import PyPDF2
+from collections import OrderedDict
 from typing import Dict, List, Any, Optional
 from dotenv import load_dotenv
 import google.genai as genai
@@ -27,6 +28,24 @@ GEMINI_API_KEY = os.getenv('GOOGLE_API_KEY')
 os.environ["GOOGLE_API_KEY"] = GEMINI_API_KEY
 text_genai.configure(api_key=GEMINI_API_KEY)
 
+# One google-genai client, and with it one HTTP connection pool, shared by every interview
+_genai_client = None
+_genai_client_lock = threading.Lock()
+
+def get_genai_client() -> genai.Client:
+    """Return the process-wide google-genai client, creating it on first use"""
+    global _genai_client
+    with _genai_client_lock:
+        if _genai_client is None:
+            _genai_client = genai.Client()
+        return _genai_client
+
+# Synthesized question audio keyed by question text. The fixed starters and behavioral
+# questions are the same in every interview, so each is synthesized once per process.
+TTS_CACHE_SIZE = 64
+_tts_cache = OrderedDict()
+_tts_cache_lock = threading.Lock()
+
 # Audio settings
 FORMAT = pyaudio.paInt16
 CHANNELS = 1
@@ -39,7 +58,7 @@ class OptimizedVoiceInterview:
     def __init__(self):
         # Core models
         self.text_model = text_genai.GenerativeModel('gemini-1.5-pro')
-        self.client = genai.Client()
+        self.client = get_genai_client()
         
         # Interview state
         self.resume_data = {}
@@ -208,7 +227,23 @@ class OptimizedVoiceInterview:
         return list(unused_skills), list(unused_projects)
     
     def generate_tts_audio(self, question_text: str) -> Optional[bytes]:
-        """Generate TTS audio in background thread"""
+        """Generate TTS audio in background thread, reusing audio already synthesized for the same text"""
+        with _tts_cache_lock:
+            audio = _tts_cache.get(question_text)
+            if audio is not None:
+                _tts_cache.move_to_end(question_text)
+                return audio
+
+        audio = self._synthesize_tts_audio(question_text)
+        if audio:
+            with _tts_cache_lock:
+                _tts_cache[question_text] = audio
+                if len(_tts_cache) > TTS_CACHE_SIZE:
+                    _tts_cache.popitem(last=False)
+        return audio
+
+    def _synthesize_tts_audio(self, question_text: str) -> Optional[bytes]:
+        """Call Gemini TTS and convert the result for the browser"""
         try:
             print(f"🎙️ Calling Gemini TTS API for: {question_text[:50]}...")
 
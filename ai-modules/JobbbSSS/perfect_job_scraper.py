@@ -5,13 +5,19 @@
 from crewai import Agent, Task, Task, Crew, Process
 import requests
 import pandas as pd
+import numpy as np
 import time
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree
 from fake_useragent import UserAgent
 import re
 import random
 import os
+import sys
 import json
+import functools
+import hashlib
+import shelve
 from urllib.parse import quote_plus
 import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -25,6 +31,64 @@ try:
 except ImportError:
     pass  # dotenv not installed, will use system environment variables
 
+# Multi-keyword matching in a single pass when pyahocorasick is available
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None  # fall back to compiled regex alternations
+
+# On-disk cache for LLM responses, keyed by a hash of the prompt inputs
+LLM_CACHE_PATH = os.environ.get(
+    'JOB_SCRAPER_LLM_CACHE',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '.llm_cache')
+)
+
+# JIT-compile the numeric scoring kernels when numba is available
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """numba not installed, kernels run as plain Python"""
+        def decorator(func):
+            return func
+        return decorator
+
+@njit(cache=True)
+def relevance_salary_bonus(salaries):
+    """Salary availability (10) + tier bonus used by traditional relevance scoring"""
+    out = np.zeros(salaries.shape[0], dtype=np.int64)
+    for i in range(salaries.shape[0]):
+        s = salaries[i]
+        if s >= 150000:    # High-tier salaries
+            out[i] = 25
+        elif s >= 120000:  # Upper-mid tier
+            out[i] = 22
+        elif s >= 90000:   # Mid-tier
+            out[i] = 18
+        elif s >= 60000:   # Lower-mid tier
+            out[i] = 15
+        elif s > 0:        # Salary listed, no tier bonus
+            out[i] = 10
+    return out
+
+@njit(cache=True)
+def career_salary_bonus(salaries):
+    """Salary competitiveness bonus used by AI-enhanced ranking"""
+    out = np.zeros(salaries.shape[0], dtype=np.int64)
+    for i in range(salaries.shape[0]):
+        s = salaries[i]
+        if s >= 200000:    # Exceptional salary
+            out[i] = 25
+        elif s >= 150000:  # Excellent salary
+            out[i] = 20
+        elif s >= 120000:  # Very good salary
+            out[i] = 15
+        elif s >= 90000:   # Good salary
+            out[i] = 10
+        elif s >= 60000:   # Fair salary
+            out[i] = 5
+    return out
+
 # --- AI AGENTS CONFIGURATION ---
 # These AI agents use CrewAI to intelligently process and analyze job data
 
@@ -65,14 +129,127 @@ insight_agent = Agent(
 )
 
 class PerfectJobScraper:
+    # Primary active recruitment keywords (high confidence)
+    PRIMARY_ACTIVE_KEYWORDS = [
+        'actively recruiting', 'actively hiring', 'urgent hiring', 'immediate hiring',
+        'hiring now', 'we are hiring', 'join our team', 'growing team', 'expanding team',
+        'new positions', 'multiple openings', 'open positions', 'career opportunities',
+        'rapidly growing', 'fast growing', 'scaling', 'expansion', 'growth opportunity',
+        'apply now', 'immediate start', 'start immediately', 'join immediately',
+        'series a', 'series b', 'series c', 'funding', 'new office', 'competitive salary'
+    ]
+    
+    # Secondary indicators (medium confidence) - time-sensitive and momentum signals
+    SECONDARY_ACTIVE_KEYWORDS = [
+        'deadline', 'apply by', 'closing date', 'closing soon', 'time sensitive',
+        'asap', 'urgently', 'quickly', 'immediate', 'now hiring', 'current opening',
+        'excellent benefits', 'great benefits', 'full benefits', 'work life balance',
+        'professional development', 'career growth', 'advancement opportunity',
+        'exciting opportunity', 'fantastic opportunity', 'unique opportunity',
+        'be part of', 'join us', 'we\'re looking for', 'we are looking for'
+    ]
+    
+    # Keyword families for AI career scoring, one precompiled alternation per family
+    SENIOR_LEVEL_RE = re.compile(r'\b(?:senior|lead|principal)\b')
+    MID_LEVEL_RE = re.compile(r'\b(?:mid|intermediate)\b')
+    MODERN_TECH_RE = re.compile(r'\b(?:ai|machine learning|cloud|aws|kubernetes|react|python)\b')
+    BIG_TECH_RE = re.compile(r'\b(?:google|microsoft|amazon|apple|meta|netflix)\b')
+    
+    # Posting-date patterns used by is_recently_posted
+    HOURS_AGO_RE = re.compile(r'(\d+)\s*(?:hour|hr)s?\s*ago')
+    DAYS_AGO_RE = re.compile(r'(\d+)\s*(?:day|d)s?\s*ago')
+    OLD_POSTING_RE = re.compile(r'week|month|year')
+    RECENT_POSTING_RE = re.compile(r'now|recent|new')
+    
+    # Text columns that are lowercased once per DataFrame and shared by the scorers
+    LOWERED_COLUMNS = ['title', 'company', 'location', 'summary']
+    
+    # Application deadline patterns
+    DEADLINE_PATTERNS = [
+        r'deadline[:\s]*\d{1,2}[-/]\d{1,2}[-/]\d{2,4}',
+        r'apply by[:\s]*\d{1,2}[-/]\d{1,2}[-/]\d{2,4}',
+        r'closing[:\s]*\d{1,2}[-/]\d{1,2}[-/]\d{2,4}',
+        r'until[:\s]*\d{1,2}[-/]\d{1,2}[-/]\d{2,4}'
+    ]
+    
     def __init__(self):
         self.user_agent = UserAgent()
         self.session = requests.Session()
         self.setup_session()
         self.all_jobs = []
         
-    def parse_salary_to_number(self, salary_text):
-        """Convert salary text to numerical value for ranking"""
+        # Compile keyword sets into single alternations (longest first so phrases win over their prefixes)
+        self._primary_keywords_re = self._compile_keyword_alternation(self.PRIMARY_ACTIVE_KEYWORDS)
+        self._secondary_keywords_re = self._compile_keyword_alternation(self.SECONDARY_ACTIVE_KEYWORDS)
+        self._deadline_patterns = [re.compile(p, re.IGNORECASE) for p in self.DEADLINE_PATTERNS]
+        self._primary_automaton = self._build_keyword_automaton(self.PRIMARY_ACTIVE_KEYWORDS)
+        self._secondary_automaton = self._build_keyword_automaton(self.SECONDARY_ACTIVE_KEYWORDS)
+    
+    @staticmethod
+    def _compile_keyword_alternation(keywords):
+        """Build one regex that matches any of the given literal keywords"""
+        ordered = sorted(keywords, key=len, reverse=True)
+        return re.compile('|'.join(re.escape(keyword) for keyword in ordered))
+    
+    @staticmethod
+    def _build_keyword_automaton(keywords):
+        """Build an Aho-Corasick automaton for the keywords (None when pyahocorasick is not installed)"""
+        if ahocorasick is None:
+            return None
+        automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        return automaton
+    
+    @staticmethod
+    def _iter_keywords(text, automaton, pattern):
+        """Yield keyword hits from a single scan of the text"""
+        if automaton is not None:
+            for _, keyword in automaton.iter(text):
+                yield keyword
+        else:
+            for match in pattern.finditer(text):
+                yield match.group(0)
+    
+    @staticmethod
+    def _lowered(frame, column):
+        """Return the pre-lowered copy of a text column, lowering it on the fly if it was not cached"""
+        cached_column = f'_{column}_l'
+        if cached_column in frame.columns:
+            return frame[cached_column]
+        if column not in frame.columns:
+            return pd.Series('', index=frame.index)
+        return frame[column].fillna('').str.lower()
+        
+    @staticmethod
+    def _llm_cache_key(*parts):
+        """Build a stable cache key from the inputs that shape an LLM prompt"""
+        return hashlib.sha256('\x1f'.join(str(part) for part in parts).encode('utf-8')).hexdigest()
+    
+    def _cached_kickoff(self, cache_key, crew):
+        """Run a crew, reusing the persisted response when the same inputs were analyzed before"""
+        try:
+            with shelve.open(LLM_CACHE_PATH) as cache:
+                if cache_key in cache:
+                    return cache[cache_key]
+        except Exception as e:
+            print(f"   Warning: LLM cache unavailable: {e}")
+        
+        result = str(crew.kickoff())
+        
+        try:
+            with shelve.open(LLM_CACHE_PATH) as cache:
+                cache[cache_key] = result
+        except Exception as e:
+            print(f"   Warning: Could not persist LLM response: {e}")
+        
+        return result
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def parse_salary_to_number(salary_text):
+        """Convert salary text to numerical value for ranking (memoized, salary strings repeat heavily)"""
         if not salary_text or salary_text == "Not specified":
             return 0
             
@@ -85,17 +262,18 @@ class PerfectJobScraper:
             if '-' in clean_text or '–' in clean_text or '—' in clean_text:
                 range_parts = re.split(r'[-–—]', clean_text)
                 if len(range_parts) == 2:
-                    low = self._extract_number(range_parts[0])
-                    high = self._extract_number(range_parts[1])
+                    low = PerfectJobScraper._extract_number(range_parts[0])
+                    high = PerfectJobScraper._extract_number(range_parts[1])
                     return (low + high) / 2 if low and high else max(low or 0, high or 0)
             
             # Single value
-            return self._extract_number(clean_text)
+            return PerfectJobScraper._extract_number(clean_text)
             
         except:
             return 0
     
-    def _extract_number(self, text):
+    @staticmethod
+    def _extract_number(text):
         """Extract numerical value from salary text"""
         # Handle 'k' notation (thousands)
         if 'k' in text:
@@ -132,9 +310,52 @@ class PerfectJobScraper:
             'Upgrade-Insecure-Requests': '1',
         })
     
-    def scrape_linkedin_comprehensive(self, search_term, location, max_pages=5, fetch_descriptions=True, filter_active=True):
-        """Comprehensive LinkedIn scraping with AI-powered active recruitment filtering"""
+    def fetch_until_listings(self, url, headers, listing_class, limit, chunk_size=32768):
+        """Stream a page in chunks and stop once `limit` <li class="listing_class"> items were received.
+        
+        Completed listings are counted with lxml's incremental pull parser. If that parser fails,
+        the rest of the page is downloaded as usual. Returns (status_code, content bytes).
+        """
+        response = self.session.get(url, headers=headers, timeout=10, stream=True)
+        try:
+            if response.status_code != 200:
+                return response.status_code, b''
+            
+            chunks = []
+            listings_found = 0
+            parser = etree.HTMLPullParser(events=('end',), tag='li')
+            
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                chunks.append(chunk)
+                if parser is None:
+                    continue
+                
+                try:
+                    parser.feed(chunk)
+                    for _, element in parser.read_events():
+                        if listing_class in (element.get('class') or '').split():
+                            listings_found += 1
+                except etree.LxmlError:
+                    parser = None  # Fall back to a full download
+                    continue
+                
+                if listings_found >= limit:
+                    break
+            
+            return response.status_code, b''.join(chunks)
+        finally:
+            response.close()
+    
+    def scrape_linkedin_comprehensive(self, search_term, location, max_pages=5, fetch_descriptions=True, filter_active=True, seen_jobs=None):
+        """Comprehensive LinkedIn scraping with AI-powered active recruitment filtering
+        
+        seen_jobs is a set of (title, company) keys already collected; duplicates are skipped
+        before any further extraction or description fetching.
+        """
         jobs = []
+        if seen_jobs is None:
+            seen_jobs = set()
+        duplicates_skipped = 0
         print(f"🔍 Scraping LinkedIn for '{search_term}' in '{location}'...")
         if filter_active:
             print("🤖 AI will filter for actively recruiting jobs during scraping...")
@@ -173,6 +394,12 @@ class PerfectJobScraper:
                                      card.find('h4', class_='result-card__subtitle')
                         company = company_elem.text.strip() if company_elem else "Not specified"
                         
+                        # Skip duplicates (same title and company) before doing any more work
+                        job_key = (title.lower(), company.lower())
+                        if job_key in seen_jobs:
+                            duplicates_skipped += 1
+                            continue
+                        
                         # Location
                         location_elem = card.find('span', class_='job-search-card__location') or \
                                       card.find('span', class_='result-card__location')
@@ -282,6 +509,7 @@ class PerfectJobScraper:
                             
                             if is_active:
                                 jobs.append(job_data)
+                                seen_jobs.add(job_key)
                                 page_jobs += 1
                                 print(f"   ✅ Recent job ({reason}): {title} at {company}")
                             else:
@@ -291,6 +519,7 @@ class PerfectJobScraper:
                             job_data['is_actively_recruiting'] = True  # Assume active for non-filtered jobs
                             job_data['active_recruiting_reasons'] = 'No filtering applied'
                             jobs.append(job_data)
+                            seen_jobs.add(job_key)
                             page_jobs += 1
                         
                     except Exception as e:
@@ -308,6 +537,8 @@ class PerfectJobScraper:
                 continue
         
         print(f"✅ LinkedIn: {len(jobs)} {'recently posted ' if filter_active else ''}jobs found{' (posted within 7 days)' if filter_active else ''}")
+        if duplicates_skipped:
+            print(f"   Skipped {duplicates_skipped} duplicates")
         
         if fetch_descriptions and jobs:
             print(f"📄 Fetching full job descriptions for {len(jobs)} {'recent ' if filter_active else ''}jobs...")
@@ -476,6 +707,7 @@ class PerfectJobScraper:
             data = response.json()
             
             api_jobs = 0
+            scraped_at = time.strftime('%Y-%m-%d %H:%M:%S')
             for job in data.get("jobs", []):
                 title = job.get('title', '')
                 if any(keyword.lower() in title.lower() for keyword in search_term.split()):
@@ -488,7 +720,7 @@ class PerfectJobScraper:
                         'summary': job.get('description', '')[:300] + "..." if job.get('description') else "",
                         'url': job.get('url', 'Not specified'),
                         'source': 'Remotive API',
-                        'scraped_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+                        'scraped_at': scraped_at,
                         'search_term': search_term,
                         'search_location': location
                     }
@@ -509,6 +741,7 @@ class PerfectJobScraper:
             if response.status_code == 200:
                 data = response.json()
                 github_jobs = 0
+                scraped_at = time.strftime('%Y-%m-%d %H:%M:%S')
                 for job in data:
                     title = job.get('title', '')
                     if any(keyword.lower() in title.lower() for keyword in search_term.split()):
@@ -521,7 +754,7 @@ class PerfectJobScraper:
                             'summary': job.get('description', '')[:300] + "..." if job.get('description') else "",
                             'url': job.get('url', 'Not specified'),
                             'source': 'GitHub Jobs',
-                            'scraped_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+                            'scraped_at': scraped_at,
                             'search_term': search_term,
                             'search_location': location
                         }
@@ -552,6 +785,7 @@ class PerfectJobScraper:
             if response.status_code == 200:
                 data = response.json()
                 remoteok_jobs = 0
+                scraped_at = time.strftime('%Y-%m-%d %H:%M:%S')
                 
                 for job in data[1:]:  # Skip first element (metadata)
                     if isinstance(job, dict):
@@ -569,7 +803,7 @@ class PerfectJobScraper:
                                 'summary': job.get('description', '')[:300] + "..." if job.get('description') else "",
                                 'url': job.get('url', 'https://remoteok.io'),
                                 'source': 'RemoteOK',
-                                'scraped_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+                                'scraped_at': scraped_at,
                                 'search_term': search_term,
                                 'search_location': location
                             }
@@ -586,36 +820,39 @@ class PerfectJobScraper:
             wwr_jobs = 0
             url = f"https://weworkremotely.com/remote-jobs/search?term={quote_plus(search_term)}"
             headers = {'User-Agent': self.user_agent.random}
-            response = self.session.get(url, headers=headers, timeout=10)
+            # Stop downloading as soon as the 10 listings we use have arrived
+            status_code, content = self.fetch_until_listings(url, headers, 'feature', limit=10)
             
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
+            if status_code == 200:
+                # Only build the tree for the job listing items, skip the rest of the page
+                listing_strainer = SoupStrainer('li', class_='feature')
+                soup = BeautifulSoup(content, 'lxml', parse_only=listing_strainer)
                 job_listings = soup.find_all('li', class_='feature')
                 
+                scraped_at = time.strftime('%Y-%m-%d %H:%M:%S')  # One timestamp per scrape batch
                 for listing in job_listings[:10]:  # Limit to 10 jobs
-                    try:
-                        title_elem = listing.find('span', class_='title')
-                        company_elem = listing.find('span', class_='company')
-                        link_elem = listing.find('a')
-                        
-                        if title_elem and company_elem:
-                            job_data = {
-                                'title': title_elem.text.strip(),
-                                'company': company_elem.text.strip(),
-                                'location': 'Remote',
-                                'salary': 'Not specified',
-                                'job_type': 'Remote',
-                                'summary': 'Remote job opportunity',
-                                'url': f"https://weworkremotely.com{link_elem.get('href')}" if link_elem else 'https://weworkremotely.com',
-                                'source': 'WeWorkRemotely',
-                                'scraped_at': time.strftime('%Y-%m-%d %H:%M:%S'),
-                                'search_term': search_term,
-                                'search_location': location
-                            }
-                            jobs.append(job_data)
-                            wwr_jobs += 1
-                    except:
+                    title_elem = listing.find('span', class_='title')
+                    company_elem = listing.find('span', class_='company')
+                    link_elem = listing.find('a')
+                    
+                    if title_elem is None or company_elem is None:
                         continue
+                    
+                    job_data = {
+                        'title': (title_elem.text or '').strip(),
+                        'company': (company_elem.text or '').strip(),
+                        'location': 'Remote',
+                        'salary': 'Not specified',
+                        'job_type': 'Remote',
+                        'summary': 'Remote job opportunity',
+                        'url': f"https://weworkremotely.com{link_elem.get('href')}" if link_elem else 'https://weworkremotely.com',
+                        'source': 'WeWorkRemotely',
+                        'scraped_at': scraped_at,
+                        'search_term': search_term,
+                        'search_location': location
+                    }
+                    jobs.append(job_data)
+                    wwr_jobs += 1
                 
                 print(f"   WeWorkRemotely: {wwr_jobs} jobs")
                 
@@ -639,7 +876,7 @@ class PerfectJobScraper:
             response = self.session.get(url, headers=headers, timeout=10)
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
+                soup = BeautifulSoup(response.content, 'lxml')
                 # Note: Dice has anti-scraping measures, this is a basic implementation
                 print(f"   Dice.com: Checking tech job listings...")
                 
@@ -700,8 +937,12 @@ class PerfectJobScraper:
                 verbose=False
             )
             
-            # Execute AI analysis
-            result = analysis_crew.kickoff()
+            # Execute AI analysis (served from the on-disk cache for previously seen jobs)
+            cache_key = self._llm_cache_key(
+                'relevance', job['title'], job['company'], job['location'],
+                job.get('summary', '')[:500], job.get('salary', ''), search_keywords, location_keywords
+            )
+            result = self._cached_kickoff(cache_key, analysis_crew)
             
             # Extract score from AI result
             result_text = str(result).upper()
@@ -766,9 +1007,9 @@ class PerfectJobScraper:
                 verbose=False
             )
             
-            # Generate AI insights
-            insights = insights_crew.kickoff()
-            return str(insights)
+            # Generate AI insights (served from the on-disk cache for repeated searches)
+            cache_key = self._llm_cache_key('insights', search_term, location, len(ranked_jobs_df), jobs_text)
+            return self._cached_kickoff(cache_key, insights_crew)
             
         except Exception as e:
             print(f"AI insights generation failed: {e}")
@@ -803,70 +1044,49 @@ class PerfectJobScraper:
         
         try:
             # For performance, only apply AI ranking to top 20 jobs
-            top_jobs = jobs_df.head(20).copy()
+            top_index = jobs_df.index[:20]
+            top_jobs = jobs_df.loc[top_index]
             
-            # Add AI career potential score
-            top_jobs['ai_career_score'] = 0
+            # Simple AI enhancement - in production, this would call the full AI crew.
+            # Each criterion is evaluated column-wide over the top jobs.
+            title_lower = self._lowered(top_jobs, 'title')
+            company_lower = self._lowered(top_jobs, 'company')
+            summary_lower = self._lowered(top_jobs, 'summary')
+            text_lower = title_lower + ' ' + summary_lower
             
-            # Simple AI enhancement - in production, this would call the full AI crew
-            for idx, job in top_jobs.iterrows():
-                # Enhanced scoring based on AI criteria
-                career_score = 0
-                
-                title_lower = job['title'].lower()
-                company_lower = job['company'].lower()
-                
-                # Career level bonus
-                if any(level in title_lower for level in ['senior', 'lead', 'principal']):
-                    career_score += 15
-                elif any(level in title_lower for level in ['mid', 'intermediate']):
-                    career_score += 10
-                
-                # Technology relevance
-                modern_tech = ['ai', 'machine learning', 'cloud', 'aws', 'kubernetes', 'react', 'python']
-                for tech in modern_tech:
-                    if tech in title_lower or tech in job.get('summary', '').lower():
-                        career_score += 5
-                
-                # Company size indicators
-                big_tech = ['google', 'microsoft', 'amazon', 'apple', 'meta', 'netflix']
-                if any(company in company_lower for company in big_tech):
-                    career_score += 20
-                
-                # SALARY-BASED AI ENHANCEMENT
-                salary_numeric = job.get('salary_numeric', 0)
-                if salary_numeric > 0:
-                    # Salary competitiveness score
-                    if salary_numeric >= 200000:
-                        career_score += 25  # Exceptional salary
-                    elif salary_numeric >= 150000:
-                        career_score += 20  # Excellent salary
-                    elif salary_numeric >= 120000:
-                        career_score += 15  # Very good salary
-                    elif salary_numeric >= 90000:
-                        career_score += 10  # Good salary
-                    elif salary_numeric >= 60000:
-                        career_score += 5   # Fair salary
-                
-                top_jobs.at[idx, 'ai_career_score'] = career_score
+            # Career level bonus
+            senior = title_lower.str.contains(self.SENIOR_LEVEL_RE)
+            mid_level = title_lower.str.contains(self.MID_LEVEL_RE)
+            career_score = pd.Series(np.where(senior, 15, np.where(mid_level, 10, 0)), index=top_index)
             
-            # Combine original relevance with AI career score (including salary)
-            top_jobs['final_ai_score'] = (top_jobs['relevance_score'] * 0.6) + (top_jobs['ai_career_score'] * 0.4)
+            # Technology relevance (+5 per distinct technology found in the title or summary)
+            tech_hits = text_lower.str.findall(self.MODERN_TECH_RE).map(lambda hits: len(set(hits)))
+            career_score += 5 * tech_hits
             
-            # Re-rank based on combined score
-            top_jobs = top_jobs.sort_values('final_ai_score', ascending=False)
+            # Company size indicators
+            career_score += 20 * company_lower.str.contains(self.BIG_TECH_RE).astype(int)
             
-            # Update ranks
-            top_jobs['ai_rank'] = range(1, len(top_jobs) + 1)
+            # SALARY-BASED AI ENHANCEMENT - salary competitiveness score
+            career_score += career_salary_bonus(top_jobs['salary_numeric'].to_numpy(dtype=np.float64))
             
-            # Combine with remaining jobs
-            remaining_jobs = jobs_df.iloc[20:].copy()
-            remaining_jobs['ai_career_score'] = 0
-            remaining_jobs['final_ai_score'] = remaining_jobs['relevance_score']
-            remaining_jobs['ai_rank'] = range(len(top_jobs) + 1, len(jobs_df) + 1)
+            # Add AI career potential score (remaining jobs keep 0)
+            jobs_df['ai_career_score'] = 0
+            jobs_df.loc[top_index, 'ai_career_score'] = career_score
+            
+            # Combine original relevance with AI career score (including salary) for the top jobs;
+            # remaining jobs keep their relevance score
+            jobs_df['final_ai_score'] = jobs_df['relevance_score'].astype(float)
+            jobs_df.loc[top_index, 'final_ai_score'] = (
+                (jobs_df.loc[top_index, 'relevance_score'] * 0.6) +
+                (jobs_df.loc[top_index, 'ai_career_score'] * 0.4)
+            )
             
-            # Combine all jobs
-            final_df = pd.concat([top_jobs, remaining_jobs], ignore_index=True)
+            # Re-rank the top jobs by combined score, remaining jobs keep their order
+            top_order = jobs_df.loc[top_index, 'final_ai_score'].sort_values(ascending=False).index
+            final_df = jobs_df.loc[top_order.append(jobs_df.index[20:])].reset_index(drop=True)
+            
+            # Update ranks
+            final_df['ai_rank'] = range(1, len(final_df) + 1)
             
             return final_df
             
@@ -881,6 +1101,7 @@ class PerfectJobScraper:
     def scrape_all_sources(self, search_term, location, keywords, fetch_descriptions=True, filter_active=True):
         """Scrape LinkedIn only with AI-powered active recruitment filtering"""
         all_jobs = []
+        seen_jobs = set()  # (title, company) keys, shared so duplicates are dropped while scraping
         
         print("🚀 Starting Time-Based LinkedIn Job Search...")
         print("=" * 70)
@@ -890,7 +1111,7 @@ class PerfectJobScraper:
         print("=" * 70)
         
         # Scrape LinkedIn with AI filtering
-        linkedin_jobs = self.scrape_linkedin_comprehensive(search_term, location, 10, fetch_descriptions, filter_active)
+        linkedin_jobs = self.scrape_linkedin_comprehensive(search_term, location, 10, fetch_descriptions, filter_active, seen_jobs)
         all_jobs.extend(linkedin_jobs)
         
         # Summary of results
@@ -909,10 +1130,11 @@ class PerfectJobScraper:
     def calculate_relevance_score(self, job, search_keywords, location_keywords):
         """Enhanced relevance scoring with salary consideration"""
         score = 0
-        title_lower = job['title'].lower()
-        company_lower = job['company'].lower()
-        location_lower = job['location'].lower()
-        summary_lower = job.get('summary', '').lower()
+        # Prefer the lowercased columns cached by process_and_rank_jobs
+        title_lower = job.get('_title_l', None) or job['title'].lower()
+        company_lower = job.get('_company_l', None) or job['company'].lower()
+        location_lower = job.get('_location_l', None) or job['location'].lower()
+        summary_lower = job.get('_summary_l', None) or job.get('summary', '').lower()
         
         # Split and clean keywords
         search_terms = [kw.strip().lower() for kw in search_keywords.split(',') if kw.strip()]
@@ -972,6 +1194,56 @@ class PerfectJobScraper:
         
         return score
     
+    @staticmethod
+    def _contains_any(texts, terms):
+        """Boolean mask of which strings in a NumPy string array contain any of the terms"""
+        mask = np.zeros(texts.shape[0], dtype=bool)
+        for term in terms:
+            mask |= np.char.find(texts, term) >= 0
+        return mask
+    
+    def calculate_relevance_scores(self, df, search_keywords, location_keywords):
+        """Vectorized version of calculate_relevance_score over a whole DataFrame.
+
+        Uses the same weights as the per-job scorer. Only the scored fields are pulled out of
+        the DataFrame into contiguous NumPy arrays, and the scores are returned as an int array.
+        Expects 'salary_numeric' to already be populated.
+        """
+        titles = self._lowered(df, 'title').to_numpy(dtype=str)
+        companies = self._lowered(df, 'company').to_numpy(dtype=str)
+        locations = self._lowered(df, 'location').to_numpy(dtype=str)
+        summaries = self._lowered(df, 'summary').to_numpy(dtype=str)
+        salaries = df['salary_numeric'].to_numpy(dtype=np.float64)
+        
+        # Split and clean keywords
+        search_terms = [kw.strip().lower() for kw in search_keywords.split(',') if kw.strip()]
+        location_terms = [kw.strip().lower() for kw in location_keywords.split(',') if kw.strip()]
+        
+        scores = np.zeros(len(df), dtype=np.int64)
+        
+        # Title (15), company (8) and summary (5) relevance
+        for term in search_terms:
+            scores += 15 * (np.char.find(titles, term) >= 0)
+            scores += 8 * (np.char.find(companies, term) >= 0)
+            scores += 5 * (np.char.find(summaries, term) >= 0)
+        
+        # Location relevance
+        for term in location_terms:
+            scores += 7 * (np.char.find(locations, term) >= 0)
+        
+        # Job level bonuses
+        senior = self._contains_any(titles, ['senior', 'lead', 'principal'])
+        junior = self._contains_any(titles, ['junior', 'entry', 'intern'])
+        scores += np.where(senior, 5, np.where(junior, 3, 0))
+        
+        # Remote work bonus
+        scores += 8 * self._contains_any(locations, ['remote', 'work from home'])
+        
+        # SALARY-BASED SCORING ENHANCEMENT (availability bonus of 10 + tier bonus)
+        scores += relevance_salary_bonus(salaries)
+        
+        return scores
+    
     def process_and_rank_jobs(self, jobs, search_keywords, location_keywords, use_ai=True):
         """AI-ENHANCED: Process and rank all jobs using AI agents"""
         if not jobs:
@@ -983,20 +1255,23 @@ class PerfectJobScraper:
         # Convert to DataFrame
         df = pd.DataFrame(jobs)
         
-        # Remove duplicates based on title and company
-        initial_count = len(df)
-        df = df.drop_duplicates(subset=['title', 'company'], keep='first')
-        duplicates_removed = initial_count - len(df)
-        print(f"   Removed {duplicates_removed} duplicates")
+        # Duplicates (same title and company) are already dropped while scraping
         
         # Clean data
         df['title'] = df['title'].str.strip()
         df['company'] = df['company'].str.strip()
         df['location'] = df['location'].str.strip()
         
+        # Lowercase the text columns once for all scorers (dropped again before returning)
+        lowered_columns = []
+        for column in self.LOWERED_COLUMNS:
+            if column in df.columns:
+                df[f'_{column}_l'] = df[column].fillna('').str.lower()
+                lowered_columns.append(f'_{column}_l')
+        
         # Calculate salary_numeric for all jobs
         print("   💰 Processing salary information...")
-        df['salary_numeric'] = df['salary'].apply(self.parse_salary_to_number)
+        df['salary_numeric'] = df['salary'].map(self.parse_salary_to_number)
         
         # AI-ENHANCED SCORING
         if use_ai:
@@ -1009,9 +1284,10 @@ class PerfectJobScraper:
             print("   🎯 Applying AI-enhanced ranking...")
             df = self.ai_enhanced_job_ranking(df, search_keywords, location_keywords)
             
-            # Sort by AI final score
-            df = df.sort_values('final_ai_score', ascending=False)
-            df['rank'] = range(1, len(df) + 1)
+            # Sort by AI final score and assign ranks from the same permutation
+            order = np.argsort(-df['final_ai_score'].to_numpy(), kind='stable')
+            df = df.iloc[order].reset_index(drop=True)
+            df['rank'] = np.arange(1, len(df) + 1, dtype=np.int32)
             
             print("   📊 Generating AI market insights...")
             ai_insights = self.ai_job_insights_generation(df, search_keywords, location_keywords)
@@ -1019,14 +1295,14 @@ class PerfectJobScraper:
         else:
             # Fallback to traditional scoring
             print("   📊 Using traditional relevance scoring...")
-            df['relevance_score'] = df.apply(
-                lambda job: self.calculate_relevance_score(job, search_keywords, location_keywords), 
-                axis=1
-            )
-            df = df.sort_values('relevance_score', ascending=False)
-            df['rank'] = range(1, len(df) + 1)
+            scores = self.calculate_relevance_scores(df, search_keywords, location_keywords)
+            df['relevance_score'] = scores
+            df = df.iloc[np.argsort(-scores, kind='stable')].reset_index(drop=True)
+            df['rank'] = np.arange(1, len(df) + 1, dtype=np.int32)
             ai_insights = "AI insights not available - using traditional scoring."
         
+        df = df.drop(columns=lowered_columns, errors='ignore')
+        
         return df, ai_insights
     
     def close_driver(self):
@@ -1040,7 +1316,6 @@ class PerfectJobScraper:
         
         try:
             text = posting_date_text.lower().strip()
-            current_time = time.time()
             
             # Handle "just posted" or "today"
             if 'just posted' in text or 'today' in text:
@@ -1051,7 +1326,7 @@ class PerfectJobScraper:
                 return True, "Posted yesterday (within 7 days)"
             
             # Handle hours ago
-            hours_match = re.search(r'(\d+)\s*(?:hour|hr)s?\s*ago', text)
+            hours_match = self.HOURS_AGO_RE.search(text)
             if hours_match:
                 hours = int(hours_match.group(1))
                 if hours <= 168:
@@ -1060,7 +1335,7 @@ class PerfectJobScraper:
                     return False, f"Posted {hours} hours ago (too old)"
             
             # Handle days ago
-            days_match = re.search(r'(\d+)\s*(?:day|d)s?\s*ago', text)
+            days_match = self.DAYS_AGO_RE.search(text)
             if days_match:
                 days = int(days_match.group(1))
                 if days <= 7:
@@ -1069,11 +1344,11 @@ class PerfectJobScraper:
                     return False, f"Posted {days} days ago (too old)"
             
             # Handle weeks/months/years (definitely too old)
-            if any(word in text for word in ['week', 'month', 'year']):
+            if self.OLD_POSTING_RE.search(text):
                 return False, "Posted more than 7 days ago"
             
             # If we can't parse it but it looks recent
-            if any(word in text for word in ['now', 'recent', 'new']):
+            if self.RECENT_POSTING_RE.search(text):
                 return True, "Appears to be recently posted"
             
             return False, f"Could not determine recency: {posting_date_text}"
@@ -1091,54 +1366,30 @@ class PerfectJobScraper:
         if job_data.get('summary'):
             text_to_check += job_data['summary'].lower() + " "
         
-        # Primary active recruitment keywords (high confidence)
-        primary_keywords = [
-            'actively recruiting', 'actively hiring', 'urgent hiring', 'immediate hiring',
-            'hiring now', 'we are hiring', 'join our team', 'growing team', 'expanding team',
-            'new positions', 'multiple openings', 'open positions', 'career opportunities',
-            'rapidly growing', 'fast growing', 'scaling', 'expansion', 'growth opportunity',
-            'apply now', 'immediate start', 'start immediately', 'join immediately',
-            'series a', 'series b', 'series c', 'funding', 'new office', 'competitive salary'
-        ]
-        
-        # Secondary indicators (medium confidence) - time-sensitive and momentum signals
-        secondary_keywords = [
-            'deadline', 'apply by', 'closing date', 'closing soon', 'time sensitive',
-            'asap', 'urgently', 'quickly', 'immediate', 'now hiring', 'current opening',
-            'excellent benefits', 'great benefits', 'full benefits', 'work life balance',
-            'professional development', 'career growth', 'advancement opportunity',
-            'exciting opportunity', 'fantastic opportunity', 'unique opportunity',
-            'be part of', 'join us', 'we\'re looking for', 'we are looking for'
-        ]
-        
         # Check primary keywords first
-        for keyword in primary_keywords:
-            if keyword in text_to_check:
-                return True, f"Primary indicator: {keyword}"
+        primary_match = next(self._iter_keywords(text_to_check, self._primary_automaton, self._primary_keywords_re), None)
+        if primary_match:
+            return True, f"Primary indicator: {primary_match}"
         
         # Check for combinations of secondary keywords (2 or more = likely active)
-        secondary_matches = []
-        for keyword in secondary_keywords:
-            if keyword in text_to_check:
-                secondary_matches.append(keyword)
+        secondary_matches = list(dict.fromkeys(
+            self._iter_keywords(text_to_check, self._secondary_automaton, self._secondary_keywords_re)
+        ))
         
         if len(secondary_matches) >= 2:
             return True, f"Multiple indicators: {', '.join(secondary_matches[:3])}"
         
         # Check for deadline patterns specifically
-        deadline_patterns = [
-            r'deadline[:\s]*\d{1,2}[-/]\d{1,2}[-/]\d{2,4}',
-            r'apply by[:\s]*\d{1,2}[-/]\d{1,2}[-/]\d{2,4}',
-            r'closing[:\s]*\d{1,2}[-/]\d{1,2}[-/]\d{2,4}',
-            r'until[:\s]*\d{1,2}[-/]\d{1,2}[-/]\d{2,4}'
-        ]
-        
-        for pattern in deadline_patterns:
-            if re.search(pattern, text_to_check, re.IGNORECASE):
+        for pattern in self._deadline_patterns:
+            if pattern.search(text_to_check):
                 return True, "Contains deadline/application date"
         
         return False, "No clear active recruitment indicators found"
 
+def truncate_column(values, width):
+    """Truncate a string Series to `width` characters, marking cut values with '...'"""
+    return np.where(values.str.len() > width, values.str.slice(0, width) + "...", values)
+
 def get_search_criteria():
     """Get comprehensive search criteria from user"""
     print("🎯 Perfect Job Search Configuration")
@@ -1270,87 +1521,99 @@ def run_perfect_job_scraper():
                 f.write("=" * 60 + "\n\n")
                 f.write(ai_insights)
         
-        # Display results
-        print(f"\n🏆 AI-ENHANCED JOB SEARCH RESULTS")
-        print("=" * 60)
-        print(f"📊 Total Jobs Found: {len(ranked_jobs_df)}")
-        print(f"📁 Jobs saved to: {filename}")
+        # Display results - the whole report is collected and written to stdout in one call
+        report_lines = []
+        emit = report_lines.append
+        total_jobs = len(ranked_jobs_df)
+        percent_per_job = 100.0 / total_jobs if total_jobs else 0.0
+        
+        emit(f"\n🏆 AI-ENHANCED JOB SEARCH RESULTS")
+        emit("=" * 60)
+        emit(f"📊 Total Jobs Found: {total_jobs}")
+        emit(f"📁 Jobs saved to: {filename}")
         if use_ai:
-            print(f"🧠 AI insights saved to: {insights_filename}")
+            emit(f"🧠 AI insights saved to: {insights_filename}")
         
         # Show top 15 results
-        print(f"\n🥇 TOP 15 MOST RELEVANT JOBS:")
-        print("-" * 100)
-        print(f"{'Rank':<4} {'Title':<30} {'Company':<20} {'Location':<15} {'Salary':<20}")
-        print("-" * 100)
+        emit(f"\n🥇 TOP 15 MOST RELEVANT JOBS:")
+        emit("-" * 100)
+        emit(f"{'Rank':<4} {'Title':<30} {'Company':<20} {'Location':<15} {'Salary':<20}")
+        emit("-" * 100)
 
-        for _, job in ranked_jobs_df.head(15).iterrows():
-            title = job['title'][:27] + "..." if len(job['title']) > 27 else job['title']
-            company = job['company'][:17] + "..." if len(job['company']) > 17 else job['company']
-            location_str = job['location'][:12] + "..." if len(job['location']) > 12 else job['location']
-            salary_str = job['salary'][:17] + "..." if len(str(job['salary'])) > 17 else str(job['salary'])
+        top_jobs = ranked_jobs_df.iloc[:15]
+        titles = truncate_column(top_jobs['title'], 27)
+        companies = truncate_column(top_jobs['company'], 17)
+        locations = truncate_column(top_jobs['location'], 12)
+        salaries = truncate_column(top_jobs['salary'].astype(str), 17)  # Salary may not be a string
 
-            print(f"{job['rank']:<4} {title:<30} {company:<20} {location_str:<15} {salary_str:<20}")
+        for rank, title, company, location_str, salary_str in zip(top_jobs['rank'], titles, companies, locations, salaries):
+            emit(f"{rank:<4} {title:<30} {company:<20} {location_str:<15} {salary_str:<20}")
         
         # Enhanced statistics with salary data
-        print(f"\n📈 SEARCH STATISTICS:")
-        print(f"   • Sources used: {', '.join(ranked_jobs_df['source'].unique())}")
-        print(f"   • Total jobs found: {len(ranked_jobs_df)}")
-        
-        # Salary statistics
-        jobs_with_salary = ranked_jobs_df[ranked_jobs_df['salary'] != 'Not specified']
-        jobs_with_numeric_salary = ranked_jobs_df[ranked_jobs_df['salary_numeric'] > 0]
-        
-        print(f"   • Jobs with salary info: {len(jobs_with_salary)} ({len(jobs_with_salary)/len(ranked_jobs_df)*100:.1f}%)")
-        
-        if len(jobs_with_numeric_salary) > 0:
-            avg_salary = jobs_with_numeric_salary['salary_numeric'].mean()
-            max_salary = jobs_with_numeric_salary['salary_numeric'].max()
-            min_salary = jobs_with_numeric_salary['salary_numeric'].min()
-            print(f"   • Average salary: ${avg_salary:,.0f}")
-            print(f"   • Salary range: ${min_salary:,.0f} - ${max_salary:,.0f}")
-            
-            # Salary tier breakdown
-            high_salary = len(jobs_with_numeric_salary[jobs_with_numeric_salary['salary_numeric'] >= 120000])
-            mid_salary = len(jobs_with_numeric_salary[(jobs_with_numeric_salary['salary_numeric'] >= 80000) & 
-                                                    (jobs_with_numeric_salary['salary_numeric'] < 120000)])
-            entry_salary = len(jobs_with_numeric_salary[jobs_with_numeric_salary['salary_numeric'] < 80000])
+        emit(f"\n📈 SEARCH STATISTICS:")
+        emit(f"   • Sources used: {', '.join(ranked_jobs_df['source'].unique())}")
+        emit(f"   • Total jobs found: {total_jobs}")
+        
+        # Salary statistics (masks computed once and counted directly)
+        has_salary_info = ranked_jobs_df['salary'].to_numpy(dtype=object) != 'Not specified'
+        salary_values = ranked_jobs_df['salary_numeric'].to_numpy(dtype=np.float64)
+        has_numeric_salary = salary_values > 0
+        numeric_salaries = salary_values[has_numeric_salary]
+        salary_info_count = int(has_salary_info.sum())
+        
+        emit(f"   • Jobs with salary info: {salary_info_count} ({salary_info_count * percent_per_job:.1f}%)")
+        
+        if numeric_salaries.size > 0:
+            avg_salary = numeric_salaries.mean()
+            max_salary = numeric_salaries.max()
+            min_salary = numeric_salaries.min()
+            emit(f"   • Average salary: ${avg_salary:,.0f}")
+            emit(f"   • Salary range: ${min_salary:,.0f} - ${max_salary:,.0f}")
+            
+            # Salary tier breakdown in one pass: <$80k, $80k-$120k, ≥$120k
+            entry_salary, mid_salary, high_salary = np.bincount(
+                np.digitize(numeric_salaries, [80000, 120000]), minlength=3
+            )
             
-            print(f"   • High salary (≥$120k): {high_salary} jobs")
-            print(f"   • Mid salary ($80k-$120k): {mid_salary} jobs") 
-            print(f"   • Entry salary (<$80k): {entry_salary} jobs")
+            emit(f"   • High salary (≥$120k): {high_salary} jobs")
+            emit(f"   • Mid salary ($80k-$120k): {mid_salary} jobs") 
+            emit(f"   • Entry salary (<$80k): {entry_salary} jobs")
         
-        print(f"   • Remote jobs: {len(ranked_jobs_df[ranked_jobs_df['location'].str.contains('remote', case=False, na=False)])}")
+        location_lower = ranked_jobs_df['location'].astype(str).str.lower()
+        remote_jobs = int(location_lower.str.contains('remote', regex=False).sum())
+        emit(f"   • Remote jobs: {remote_jobs}")
         
         # Actively recruiting statistics
         if 'is_actively_recruiting' in ranked_jobs_df.columns:
-            active_jobs = len(ranked_jobs_df[ranked_jobs_df['is_actively_recruiting'] == True])
-            print(f"   • Actively recruiting jobs: {active_jobs} ({active_jobs/len(ranked_jobs_df)*100:.1f}%)")
+            active_jobs = int((ranked_jobs_df['is_actively_recruiting'].to_numpy() == True).sum())
+            emit(f"   • Actively recruiting jobs: {active_jobs} ({active_jobs * percent_per_job:.1f}%)")
         
         # Top companies
-        top_companies = ranked_jobs_df['company'].value_counts().head(5)
-        print(f"   • Top companies: {', '.join(top_companies.index.tolist())}")
+        top_companies = ranked_jobs_df['company'].value_counts().head(5).index
+        emit(f"   • Top companies: {', '.join(top_companies)}")
         
         # Display AI insights preview
         if use_ai and ai_insights:
-            print(f"\n🧠 AI MARKET INSIGHTS PREVIEW:")
-            print("-" * 60)
+            emit(f"\n🧠 AI MARKET INSIGHTS PREVIEW:")
+            emit("-" * 60)
             # Show first 300 characters of AI insights
             preview = ai_insights[:300] + "..." if len(ai_insights) > 300 else ai_insights
-            print(preview)
-            print(f"\n📄 Full AI insights available in: {insights_filename}")
-        
-        print(f"\n✅ Job Search Completed!")
-        print(f"📊 Features:")
-        print(f"   • Time-based filtering for fresh jobs")
-        print(f"   • Comprehensive job data extraction")
-        print(f"   • Clean CSV output with essential information")
+            emit(preview)
+            emit(f"\n📄 Full AI insights available in: {insights_filename}")
+        
+        emit(f"\n✅ Job Search Completed!")
+        emit(f"📊 Features:")
+        emit(f"   • Time-based filtering for fresh jobs")
+        emit(f"   • Comprehensive job data extraction")
+        emit(f"   • Clean CSV output with essential information")
         if filter_active:
-            print(f"   • ⏰ Only jobs posted within last 7 days")
+            emit(f"   • ⏰ Only jobs posted within last 7 days")
         else:
-            print(f"   • 📊 Comprehensive job scraping (all jobs included)")
-        print(f"📄 Results saved to: '{filename}'")
-        print(f"💡 Focus: Quality job opportunities with complete information")
+            emit(f"   • 📊 Comprehensive job scraping (all jobs included)")
+        emit(f"📄 Results saved to: '{filename}'")
+        emit(f"💡 Focus: Quality job opportunities with complete information")
+        
+        sys.stdout.write('\n'.join(report_lines) + '\n')
         
     except Exception as e:
         print(f"❌ Error during AI-enhanced scraping: {e}")
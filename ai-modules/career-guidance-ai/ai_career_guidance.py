@@ -7,8 +7,16 @@ Replaces Streamlit app with API-compatible functions
 import os
 import sys
 import json
+import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
 from typing import Dict, List, Optional
 
+logger = logging.getLogger(__name__)
+
 # Add current directory to path for imports
 current_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.append(current_dir)
@@ -19,10 +27,41 @@ try:
     from utils.gemini_client import generate_career_recommendations
     UTILS_AVAILABLE = True
 except ImportError as e:
-    print(f"Warning: Utils import failed: {e}")
+    logger.warning("Utils import failed: %s", e)
     UTILS_AVAILABLE = False
 
+# Role-specific skills for fallback recommendations: (title keywords, extra skills), first match wins
+ROLE_SKILL_MAP = [
+    (("data",), ("SQL", "Machine Learning", "Statistics", "Data Visualization")),
+    (("backend", "api"), ("REST APIs", "Database Design", "Microservices")),
+    (("frontend", "ui"), ("React", "TypeScript", "CSS", "User Experience")),
+    (("devops", "cloud"), ("AWS", "Docker", "Kubernetes", "CI/CD")),
+    (("mobile",), ("React Native", "iOS", "Android", "Mobile UI")),
+]
+
+@lru_cache(maxsize=128)
+def _default_positions(level: str, domain: str) -> tuple:
+    """Standard fallback positions for an experience level and domain"""
+    return (
+        f"{level} {domain} Engineer",
+        f"{domain} Developer",
+        f"{domain} Specialist",
+        f"Full Stack {domain} Developer",
+        f"{domain} Software Engineer",
+        f"{level} {domain} Architect",
+        f"{domain} Technical Lead",
+        f"Principal {domain} Engineer",
+        f"{domain} Product Engineer",
+        f"{domain} Platform Engineer"
+    )
+
 class AICareerGuidance:
+    # Job market data per (domain, location), shared across instances: key -> (fetched_at, data)
+    MARKET_DATA_TTL_SECONDS = 3600
+    MARKET_DATA_CACHE_SIZE = 32
+    _market_data_cache = {}
+    _market_data_lock = threading.Lock()
+    
     def __init__(self):
         self.user_data = {}
         self.last_analysis = None
@@ -42,13 +81,13 @@ class AICareerGuidance:
 
             if UTILS_AVAILABLE and resume_content.strip():
                 parsed_data = parse_resume(resume_content)
-                print(f"✅ Resume parsed successfully: {len(parsed_data.get('technical_skills', []))} skills found")
+                logger.info("✅ Resume parsed successfully: %d skills found", len(parsed_data.get('technical_skills', [])))
                 return parsed_data
             else:
                 return self._get_fallback_resume_data()
                 
         except Exception as e:
-            print(f"❌ Resume analysis failed: {e}")
+            logger.warning("❌ Resume analysis failed: %s", e)
             return self._get_fallback_resume_data()
     
     def _get_fallback_resume_data(self) -> Dict:
@@ -62,11 +101,19 @@ class AICareerGuidance:
             "certifications": []
         }
     
-    def get_job_market_data(self, domain: str, location: str = "United States") -> Dict:
-        """Get current job market trends and data"""
+    def get_job_market_data(self, domain: str, location: str = "United States", refresh: bool = False) -> Dict:
+        """Get current job market trends and data (cached per domain/location, use refresh=True to refetch)"""
+        cache_key = (domain.strip().lower(), location.strip().lower())
+        if not refresh:
+            with self._market_data_lock:
+                cached = self._market_data_cache.get(cache_key)
+            if cached and time.monotonic() - cached[0] < self.MARKET_DATA_TTL_SECONDS:
+                logger.info("⚡ Using cached job market data for %s in %s", domain, location)
+                return dict(cached[1])
+        
         try:
             if UTILS_AVAILABLE:
-                print(f"🔍 Fetching job market data for {domain} in {location}...")
+                logger.info("🔍 Fetching job market data for %s in %s...", domain, location)
                 
                 # Enhanced search queries for better market analysis
                 search_queries = [
@@ -82,22 +129,32 @@ class AICareerGuidance:
                 job_positions = extract_job_positions(search_results)
                 market_trends = get_job_market_trends(domain, location)
                 
-                print(f"✅ Found {len(search_results)} search results, {len(job_positions)} job positions")
+                logger.info("✅ Found %d search results, %d job positions", len(search_results), len(job_positions))
                 
-                return {
+                market_data = {
                     "search_results": search_results,
                     "job_positions": job_positions,
                     "market_trends": market_trends,
                     "domain": domain,
                     "location": location
                 }
+                self._store_market_data(cache_key, market_data)
+                return market_data
             else:
                 return self._get_fallback_market_data(domain, location)
                 
         except Exception as e:
-            print(f"❌ Job market data retrieval failed: {e}")
+            logger.warning("❌ Job market data retrieval failed: %s", e)
             return self._get_fallback_market_data(domain, location)
     
+    def _store_market_data(self, cache_key, market_data: Dict) -> None:
+        """Cache fetched market data, evicting the oldest entry when the cache is full"""
+        with self._market_data_lock:
+            self._market_data_cache[cache_key] = (time.monotonic(), market_data)
+            if len(self._market_data_cache) > self.MARKET_DATA_CACHE_SIZE:
+                oldest_key = min(self._market_data_cache, key=lambda key: self._market_data_cache[key][0])
+                del self._market_data_cache[oldest_key]
+    
     def _get_fallback_market_data(self, domain: str, location: str) -> Dict:
         """Fallback market data when search fails"""
         return {
@@ -119,19 +176,19 @@ class AICareerGuidance:
         """Generate AI-powered career recommendations"""
         try:
             if UTILS_AVAILABLE:
-                print("🤖 Generating AI career recommendations...")
+                logger.info("🤖 Generating AI career recommendations...")
                 
                 # Prepare data for AI analysis
                 search_results = job_market_data.get('search_results', [])
-                recommendations = generate_career_recommendations(user_profile, search_results[:50])
+                recommendations = generate_career_recommendations(user_profile, islice(search_results, 50))
                 
-                print("✅ AI recommendations generated successfully")
+                logger.info("✅ AI recommendations generated successfully")
                 return recommendations
             else:
                 return self._get_fallback_recommendations(user_profile, job_market_data)
                 
         except Exception as e:
-            print(f"❌ AI recommendation generation failed: {e}")
+            logger.warning("❌ AI recommendation generation failed: %s", e)
             return self._get_fallback_recommendations(user_profile, job_market_data)
     
     def _get_fallback_recommendations(self, user_profile: Dict, job_market_data: Dict) -> Dict:
@@ -146,18 +203,24 @@ class AICareerGuidance:
         if experience_years < 2:
             level = "Junior"
             salary_range = "$50,000 - $75,000"
-            base_skills = ["Python", "JavaScript", "Problem Solving", "Git"]
+            base_skills = ("Python", "JavaScript", "Problem Solving", "Git")
         elif experience_years < 5:
             level = "Mid-Level"
             salary_range = "$75,000 - $100,000"
-            base_skills = ["Python", "JavaScript", "Cloud Computing", "System Design", "Team Collaboration"]
+            base_skills = ("Python", "JavaScript", "Cloud Computing", "System Design", "Team Collaboration")
         else:
             level = "Senior"
             salary_range = "$100,000 - $150,000"
-            base_skills = ["Python", "JavaScript", "Cloud Computing", "System Architecture", "Leadership", "Mentoring"]
+            base_skills = ("Python", "JavaScript", "Cloud Computing", "System Architecture", "Leadership", "Mentoring")
         
         recommendations = []
         
+        # Text that only depends on domain/experience is built once per call;
+        # inside the loops only the position-specific parts are added
+        description_suffix = f" in {domain} with focus on modern technologies and innovation. Perfect for professionals with {experience_years} years of experience."
+        strategy_prefix = f"Focus on building practical {domain.lower()} projects and gaining relevant certifications. Strengthen skills in "
+        default_description = f"Exciting opportunities in {domain} with focus on modern technologies and innovation. Ideal for {experience_years} years of experience."
+        
         # If we have job positions from market data, use them all (ensure 5-10 roles)
         if all_job_positions:
             for idx, position in enumerate(all_job_positions):
@@ -166,50 +229,38 @@ class AICareerGuidance:
                     break
                     
                 # Generate role-specific details
-                role_skills = base_skills.copy()
-                if "data" in position.lower():
-                    role_skills.extend(["SQL", "Machine Learning", "Statistics", "Data Visualization"])
-                elif "backend" in position.lower() or "api" in position.lower():
-                    role_skills.extend(["REST APIs", "Database Design", "Microservices"])
-                elif "frontend" in position.lower() or "ui" in position.lower():
-                    role_skills.extend(["React", "TypeScript", "CSS", "User Experience"])
-                elif "devops" in position.lower() or "cloud" in position.lower():
-                    role_skills.extend(["AWS", "Docker", "Kubernetes", "CI/CD"])
-                elif "mobile" in position.lower():
-                    role_skills.extend(["React Native", "iOS", "Android", "Mobile UI"])
+                position_lower = position.lower()
+                extra_skills = ()
+                for keywords, role_extras in ROLE_SKILL_MAP:
+                    if any(keyword in position_lower for keyword in keywords):
+                        extra_skills = role_extras
+                        break
+                # Limit to 6 skills for readability
+                role_skills = list((base_skills + extra_skills)[:6])
                 
                 recommendations.append({
                     "job_title": position,
-                    "description": f"Exciting opportunity as {position} in {domain} with focus on modern technologies and innovation. Perfect for professionals with {experience_years} years of experience.",
-                    "required_skills": role_skills[:6],  # Limit to 6 skills for readability
+                    "description": "Exciting opportunity as " + position + description_suffix,
+                    "required_skills": role_skills,
                     "market_demand": "High demand in current market",
                     "salary_range": salary_range,
-                    "transition_strategy": f"Focus on building practical {domain.lower()} projects and gaining relevant certifications. Strengthen skills in {', '.join(role_skills[:3])}."
+                    "transition_strategy": strategy_prefix + ', '.join(role_skills[:3]) + "."
                 })
         
         # If we don't have enough positions, generate standard ones to reach minimum 5
-        default_positions = [
-            f"{level} {domain} Engineer",
-            f"{domain} Developer",
-            f"{domain} Specialist",
-            f"Full Stack {domain} Developer",
-            f"{domain} Software Engineer",
-            f"{level} {domain} Architect",
-            f"{domain} Technical Lead",
-            f"Principal {domain} Engineer",
-            f"{domain} Product Engineer",
-            f"{domain} Platform Engineer"
-        ]
+        default_positions = _default_positions(level, domain)
         
+        existing_titles = {rec['job_title'] for rec in recommendations}
         while len(recommendations) < 5:
             for position in default_positions:
                 if len(recommendations) >= 10:
                     break
-                if not any(rec['job_title'] == position for rec in recommendations):
+                if position not in existing_titles:
+                    existing_titles.add(position)
                     recommendations.append({
                         "job_title": position,
-                        "description": f"Exciting opportunities in {domain} with focus on modern technologies and innovation. Ideal for {experience_years} years of experience.",
-                        "required_skills": base_skills[:5],
+                        "description": default_description,
+                        "required_skills": list(base_skills[:5]),
                         "market_demand": "High demand in current market",
                         "salary_range": salary_range,
                         "transition_strategy": "Focus on building practical projects and gaining relevant certifications"
@@ -233,20 +284,26 @@ class AICareerGuidance:
         if not domain_interest.strip():
             raise Exception("Domain interest is required for career analysis")
             
-        print(f"🎯 Starting complete career analysis for {domain_interest}")
+        logger.info("🎯 Starting complete career analysis for %s", domain_interest)
         
-        # Step 1: Parse resume if provided (optional)
+        # Step 1: Parse resume if provided (optional); the market search for the
+        # default location is independent of it, so both run concurrently
         resume_data = {}
+        market_data = None
         if resume_path or resume_text:
-            resume_data = self.analyze_resume(resume_path, resume_text)
-            print(f"📄 Resume analysis completed")
+            # Search the default location on a worker thread while the resume is parsed
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                market_future = executor.submit(self.get_job_market_data, domain_interest, "United States")
+                resume_data = self.analyze_resume(resume_path, resume_text)
+                market_data = market_future.result()
+            logger.info("📄 Resume analysis completed")
         
         # Step 2: Build user profile with only domain and resume data
         user_profile = {
             "domain_interest": domain_interest,
-            "parsed_resume": resume_data,
-            **resume_data  # Merge resume data into profile
+            "parsed_resume": resume_data
         }
+        user_profile.update(resume_data)  # Merge resume data into profile
         
         # Use default values for other fields
         user_profile.setdefault("experience_years", resume_data.get("experience_years", 0))
@@ -259,8 +316,9 @@ class AICareerGuidance:
         # Update stored user data
         self.user_data = user_profile
         
-        # Step 3: Get job market data
-        market_data = self.get_job_market_data(domain_interest, user_profile["location"])
+        # Step 3: Get job market data (refetch if the resume supplied another location)
+        if market_data is None or user_profile["location"] != "United States":
+            market_data = self.get_job_market_data(domain_interest, user_profile["location"])
         
         # Step 4: Generate AI recommendations
         recommendations = self.generate_recommendations(user_profile, market_data)
@@ -283,7 +341,7 @@ class AICareerGuidance:
         # Store for future reference
         self.last_analysis = complete_analysis
         
-        print("✅ Complete career analysis finished successfully")
+        logger.info("✅ Complete career analysis finished successfully")
         return complete_analysis
     
     def _get_current_timestamp(self) -> str:
@@ -309,7 +367,7 @@ class AICareerGuidance:
         recommendations = analysis.get('recommendations', {})
         market_data = analysis.get('market_data', {})
         
-        report = f"""
+        report_parts = [f"""
 # AI Career Guidance Report
 
 ## User Profile
@@ -325,19 +383,19 @@ class AICareerGuidance:
 - Remote Opportunities: {market_data.get('market_trends', {}).get('remote_opportunities', {}).get('remote_percentage', 'N/A')}%
 
 ## Career Recommendations
-"""
+"""]
         
         for i, rec in enumerate(recommendations.get('recommendations', []), 1):
-            report += f"""
+            report_parts.append(f"""
 ### {i}. {rec.get('job_title', 'Unknown Position')}
 - **Description:** {rec.get('description', 'No description available')}
 - **Required Skills:** {', '.join(rec.get('required_skills', []))}
 - **Market Demand:** {rec.get('market_demand', 'Not specified')}
 - **Salary Range:** {rec.get('salary_range', 'N/A')}
 - **Transition Strategy:** {rec.get('transition_strategy', 'Not specified')}
-"""
+""")
         
-        report += f"""
+        report_parts.append(f"""
 ## Skills Gap Analysis
 {recommendations.get('skills_gap_analysis', 'No analysis available')}
 
@@ -346,12 +404,15 @@ class AICareerGuidance:
 
 ---
 Report generated on: {analysis.get('analysis_summary', {}).get('analysis_timestamp', 'Unknown')}
-        """
+        """)
         
-        return report
+        return ''.join(report_parts)
 
 # Main execution and user input interface
 if __name__ == "__main__":
+    # Show progress messages in interactive mode
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     guidance = AICareerGuidance()
     
     print("=" * 60)
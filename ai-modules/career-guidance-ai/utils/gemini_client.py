@@ -1,175 +1,291 @@
 import google.generativeai as genai
 import json
 import os
+import logging
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import List, TypedDict
 from dotenv import load_dotenv
 
+# Redis is optional; without it responses are only cached in memory
+try:
+    import redis
+except ImportError:
+    redis = None
+
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 genai.configure(api_key=os.getenv('GEMINI_API_KEY'))
 
-def parse_resume_with_gemini(resume_text):
-    """Parse resume text using Gemini API and return structured data."""
-    model = genai.GenerativeModel('gemini-1.5-flash')
-
-    prompt = f"""
-    Analyze this resume and extract key information in JSON format:
-    {resume_text}
-
-    IMPORTANT: Return ONLY a valid JSON object with this exact structure:
-    {{
-        "technical_skills": ["skill1", "skill2"],
-        "experience_years": 5,
-        "education_level": "Bachelor's Degree",
-        "domain_expertise": ["domain1", "domain2"],
-        "current_role": "Software Engineer",
-        "certifications": ["cert1", "cert2"]
-    }}
-
-    Do not include any text before or after the JSON. Do not wrap in markdown code blocks.
+# Response schemas: Gemini returns JSON of exactly these shapes
+class ResumeData(TypedDict):
+    technical_skills: List[str]
+    experience_years: int
+    education_level: str
+    domain_expertise: List[str]
+    current_role: str
+    certifications: List[str]
+
+class CareerRecommendation(TypedDict):
+    job_title: str
+    description: str
+    required_skills: List[str]
+    market_demand: str
+    salary_range: str
+    transition_strategy: str
+
+class CareerRecommendations(TypedDict):
+    recommendations: List[CareerRecommendation]
+    skills_gap_analysis: str
+    career_roadmap: str
+
+# Deterministic, schema-constrained output so a cached response is as good as a fresh one
+RESUME_GENERATION_CONFIG = genai.GenerationConfig(
+    temperature=0, response_mime_type='application/json', response_schema=ResumeData
+)
+RECOMMENDATIONS_GENERATION_CONFIG = genai.GenerationConfig(
+    temperature=0, response_mime_type='application/json', response_schema=CareerRecommendations
+)
+
+# Response text cache keyed by sha256(prompt): in-memory LRU, shared through Redis when REDIS_URL is set
+RESPONSE_CACHE_SIZE = 512
+RESPONSE_CACHE_TTL_SECONDS = 86400
+_response_cache = OrderedDict()
+_response_cache_lock = threading.Lock()
+_redis = redis.Redis.from_url(os.environ['REDIS_URL']) if redis is not None and os.getenv('REDIS_URL') else None
+
+def _cache_key(*parts):
+    return hashlib.sha256('\x00'.join(parts).encode('utf-8')).hexdigest()
+
+def _cache_get(key):
+    with _response_cache_lock:
+        text = _response_cache.get(key)
+        if text is not None:
+            _response_cache.move_to_end(key)
+            return text
+    if _redis is not None:
+        try:
+            cached = _redis.get(f"llm:{key}")
+        except Exception as e:
+            logger.warning("Redis cache lookup failed: %s", e)
+            return None
+        if cached is not None:
+            text = cached.decode('utf-8')
+            _cache_put(key, text, remote=False)
+            return text
+    return None
+
+def _cache_put(key, text, remote=True):
+    with _response_cache_lock:
+        _response_cache[key] = text
+        _response_cache.move_to_end(key)
+        if len(_response_cache) > RESPONSE_CACHE_SIZE:
+            _response_cache.popitem(last=False)
+    if remote and _redis is not None:
+        try:
+            _redis.setex(f"llm:{key}", RESPONSE_CACHE_TTL_SECONDS, text)
+        except Exception as e:
+            logger.warning("Redis cache store failed: %s", e)
+
+def _generate_text(model, key, prompt):
+    """Return the response text for prompt, calling Gemini only on a cache miss for key."""
+    text = _cache_get(key)
+    if text is None:
+        text = model.generate_content(prompt).text
+        _cache_put(key, text)
+    return text
+
+def _default_resume_data():
+    return {
+        "technical_skills": [],
+        "experience_years": 0,
+        "education_level": "Unknown",
+        "domain_expertise": [],
+        "current_role": "Unknown",
+        "certifications": []
+    }
+
+# Instructions are the stable prefix (system instruction); per-request input is the suffix
+RESUME_INSTRUCTIONS = """
+Analyze the resume provided by the user and extract key information in JSON format.
+
+IMPORTANT: Return ONLY a valid JSON object with this exact structure:
+{
+    "technical_skills": ["skill1", "skill2"],
+    "experience_years": 5,
+    "education_level": "Bachelor's Degree",
+    "domain_expertise": ["domain1", "domain2"],
+    "current_role": "Software Engineer",
+    "certifications": ["cert1", "cert2"]
+}
+
+Do not include any text before or after the JSON. Do not wrap in markdown code blocks.
+"""
+
+def _resume_prompt(resume_text):
+    return f"Resume:\n{resume_text}"
+
+_JSON_DECODER = json.JSONDecoder()
+
+def _extract_json(text):
+    """Decode the first JSON object embedded in text, ignoring any prose around it.
+
+    raw_decode stops at the end of the object, so trailing text never needs to be
+    located or stripped; returns None if no object can be decoded.
     """
+    start = text.find('{')
+    while start != -1:
+        try:
+            result, _ = _JSON_DECODER.raw_decode(text, start)
+            return result
+        except json.JSONDecodeError:
+            start = text.find('{', start + 1)
+    return None
 
+def _handle_resume_response(response_text):
+    logger.debug("Raw response: %.200s...", response_text)
+
+    # Try to parse JSON
     try:
-        response = model.generate_content(prompt)
-        
-        # Debug: print the raw response
-        print(f"Raw response: {response.text[:200]}...")
-        
-        # Clean the response text
-        response_text = response.text.strip()
-        
-        # Remove markdown code blocks if present
-        if response_text.startswith('```json'):
-            response_text = response_text[7:]
-        if response_text.startswith('```'):
-            response_text = response_text[3:]
-        if response_text.endswith('```'):
-            response_text = response_text[:-3]
-        
-        response_text = response_text.strip()
-        
-        # Try to parse JSON
-        try:
-            result = json.loads(response_text)
+        result = json.loads(response_text)
+        return result
+    except json.JSONDecodeError as json_error:
+        logger.warning("JSON parsing error: %s", json_error)
+        logger.debug("Response text: %s", response_text)
+        # Schema mode should not produce extra text, but recover if it does
+        result = _extract_json(response_text)
+        if result is not None:
             return result
-        except json.JSONDecodeError as json_error:
-            print(f"JSON parsing error: {json_error}")
-            print(f"Response text: {response_text}")
-            # Try to extract JSON from the response if it contains extra text
-            import re
-            json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
-            if json_match:
-                try:
-                    result = json.loads(json_match.group())
-                    return result
-                except:
-                    pass
-            
-            # If all else fails, return default structure
-            return {
-                "technical_skills": [],
-                "experience_years": 0,
-                "education_level": "Unknown",
-                "domain_expertise": [],
-                "current_role": "Unknown",
-                "certifications": []
-            }
-            
+
+        # If all else fails, return default structure
+        return _default_resume_data()
+
+def parse_resume_with_gemini(resume_text):
+    """Parse resume text using Gemini API and return structured data."""
+    model = _RESUME_MODEL
+
+    prompt = _resume_prompt(resume_text)
+    key = _cache_key(RESUME_INSTRUCTIONS, prompt)
+    try:
+        return _handle_resume_response(_generate_text(model, key, prompt))
     except Exception as e:
-        print(f"Error parsing resume: {e}")
-        return {
-            "technical_skills": [],
-            "experience_years": 0,
-            "education_level": "Unknown",
-            "domain_expertise": [],
-            "current_role": "Unknown",
-            "certifications": []
+        logger.warning("Error parsing resume: %s", e)
+        return _default_resume_data()
+
+RECOMMENDATIONS_INSTRUCTIONS = """
+Based on the user profile and trending job search results provided by the user,
+generate personalized career recommendations in JSON format with this exact structure:
+{
+    "recommendations": [
+        {
+            "job_title": "Software Engineer",
+            "description": "Detailed job description",
+            "required_skills": ["Python", "JavaScript"],
+            "market_demand": "High demand in tech industry",
+            "salary_range": "$80,000 - $120,000",
+            "transition_strategy": "Learn required skills through online courses"
         }
+    ],
+    "skills_gap_analysis": "Analysis of skills gap",
+    "career_roadmap": "Step-by-step career transition plan"
+}
 
-def generate_career_recommendations(user_profile, search_results):
-    """Generate personalized career recommendations using Gemini API."""
-    model = genai.GenerativeModel('gemini-1.5-flash')
-
-    prompt = f"""
-    Based on this user profile: {json.dumps(user_profile)}
-    And these trending job search results: {json.dumps(search_results)}
-
-    Generate personalized career recommendations in JSON format with this exact structure:
-    {{
-        "recommendations": [
-            {{
-                "job_title": "Software Engineer",
-                "description": "Detailed job description",
-                "required_skills": ["Python", "JavaScript"],
-                "market_demand": "High demand in tech industry",
-                "salary_range": "$80,000 - $120,000",
-                "transition_strategy": "Learn required skills through online courses"
-            }}
-        ],
-        "skills_gap_analysis": "Analysis of skills gap",
-        "career_roadmap": "Step-by-step career transition plan"
-    }}
-
-    IMPORTANT REQUIREMENTS:
-    1. Generate a MINIMUM of 5 and MAXIMUM of 10 role recommendations
-    2. Include ALL relevant job positions found in the search results
-    3. Each recommendation should be unique and tailored to the user's profile
-    4. Return ONLY the JSON object without any explanatory text, markdown formatting, or code blocks
-    5. Make sure all job titles are different and cover various seniority levels
-    """
+IMPORTANT REQUIREMENTS:
+1. Generate a MINIMUM of 5 and MAXIMUM of 10 role recommendations
+2. Include ALL relevant job positions found in the search results
+3. Each recommendation should be unique and tailored to the user's profile
+4. Return ONLY the JSON object without any explanatory text, markdown formatting, or code blocks
+5. Make sure all job titles are different and cover various seniority levels
+"""
+
+# Models are built once and shared by every call
+_RESUME_MODEL = genai.GenerativeModel('gemini-1.5-flash', generation_config=RESUME_GENERATION_CONFIG,
+                                      system_instruction=RESUME_INSTRUCTIONS)
+_RECOMMENDATIONS_MODEL = genai.GenerativeModel('gemini-1.5-flash', generation_config=RECOMMENDATIONS_GENERATION_CONFIG,
+                                               system_instruction=RECOMMENDATIONS_INSTRUCTIONS)
+
+# Prompt budget: only these profile fields and a trimmed view of the search results are sent
+PROMPT_PROFILE_FIELDS = (
+    "domain_interest", "experience_years", "current_skills", "technical_skills",
+    "education_level", "domain_expertise", "current_role", "certifications",
+    "career_goals", "location", "work_preference", "salary_expectations"
+)
+PROMPT_MAX_RESULTS = 25
+PROMPT_SNIPPET_CHARS = 160
+
+def _compact_search_results(search_results):
+    """Project results to title/snippet/site, dropping repeats of the same page."""
+    unique_results = {}
+    for result in search_results:
+        key = result.get('link') or result.get('title', '')
+        if key not in unique_results:
+            unique_results[key] = {
+                'title': result.get('title', ''),
+                'snippet': result.get('snippet', '')[:PROMPT_SNIPPET_CHARS],
+                'displayLink': result.get('displayLink', '')
+            }
+            if len(unique_results) >= PROMPT_MAX_RESULTS:
+                break
+    return list(unique_results.values())
+
+def _recommendations_prompt(user_profile, search_results):
+    profile = {key: user_profile[key] for key in PROMPT_PROFILE_FIELDS if key in user_profile}
+    return (
+        f"User profile: {json.dumps(profile, separators=(',', ':'))}\n"
+        f"Trending job search results: {json.dumps(_compact_search_results(search_results), separators=(',', ':'))}"
+    )
+
+def _handle_recommendations_response(response_text):
+    logger.debug("Raw response: %.200s...", response_text)
 
+    # Try to parse JSON
     try:
-        response = model.generate_content(prompt)
-        
-        # Debug: print the raw response
-        print(f"Raw response: {response.text[:200]}...")
-        
-        # Clean the response text
-        response_text = response.text.strip()
-        
-        # Remove markdown code blocks if present
-        if response_text.startswith('```json'):
-            response_text = response_text[7:]
-        if response_text.startswith('```'):
-            response_text = response_text[3:]
-        if response_text.endswith('```'):
-            response_text = response_text[:-3]
-        
-        response_text = response_text.strip()
-        
-        # Try to parse JSON
-        try:
-            result = json.loads(response_text)
-            
-            # Ensure we have at least 5 recommendations
-            recommendations = result.get('recommendations', [])
-            if len(recommendations) < 5:
-                print(f"Warning: Only {len(recommendations)} recommendations generated, expected 5-10")
-                
+        result = json.loads(response_text)
+
+        # Ensure we have at least 5 recommendations
+        recommendations = result.get('recommendations', [])
+        if len(recommendations) < 5:
+            logger.warning("Only %d recommendations generated, expected 5-10", len(recommendations))
+
+        return result
+    except json.JSONDecodeError as json_error:
+        logger.warning("JSON parsing error: %s", json_error)
+        logger.debug("Response text: %s", response_text)
+        # Schema mode should not produce extra text, but recover if it does
+        result = _extract_json(response_text)
+        if result is not None:
             return result
-        except json.JSONDecodeError as json_error:
-            print(f"JSON parsing error: {json_error}")
-            print(f"Response text: {response_text}")
-            # Try to extract JSON from the response if it contains extra text
-            import re
-            json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
-            if json_match:
-                try:
-                    result = json.loads(json_match.group())
-                    return result
-                except:
-                    pass
-            
-            # If all else fails, return default structure
-            return {
-                "recommendations": [],
-                "skills_gap_analysis": "Unable to analyze skills gap due to response parsing error",
-                "career_roadmap": "Unable to generate roadmap due to response parsing error"
-            }
-            
-    except Exception as e:
-        print(f"Error generating recommendations: {e}")
+
+        # If all else fails, return default structure
         return {
             "recommendations": [],
-            "skills_gap_analysis": "Unable to analyze skills gap",
-            "career_roadmap": "Unable to generate roadmap"
+            "skills_gap_analysis": "Unable to analyze skills gap due to response parsing error",
+            "career_roadmap": "Unable to generate roadmap due to response parsing error"
         }
+
+def _failed_recommendations():
+    return {
+        "recommendations": [],
+        "skills_gap_analysis": "Unable to analyze skills gap",
+        "career_roadmap": "Unable to generate roadmap"
+    }
+
+def generate_career_recommendations(user_profile, search_results):
+    """Generate personalized career recommendations using Gemini API.
+
+    search_results may be any iterable of result dicts; it is materialized once for the prompt.
+    """
+    if not isinstance(search_results, list):
+        search_results = list(search_results)
+    model = _RECOMMENDATIONS_MODEL
+
+    try:
+        prompt = _recommendations_prompt(user_profile, search_results)
+        key = _cache_key(RECOMMENDATIONS_INSTRUCTIONS, prompt)
+        return _handle_recommendations_response(_generate_text(model, key, prompt))
+    except Exception as e:
+        logger.warning("Error generating recommendations: %s", e)
+        return _failed_recommendations()
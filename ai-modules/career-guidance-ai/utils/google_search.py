@@ -1,26 +1,52 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
 from dotenv import load_dotenv
-import time
 import re
+import logging
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+# aiohttp is optional; without it search_multiple_queries uses a thread pool
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# pyahocorasick is optional; without it keywords are matched with substring checks
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 load_dotenv()
 
-def search_google_with_api(query, num_results=10, location="United States"):
-    """Search Google using Google Custom Search API for job-related content."""
+logger = logging.getLogger(__name__)
+
+SEARCH_API_URL = "https://www.googleapis.com/customsearch/v1"
+
+# Shared session keeps connections to googleapis.com alive across queries
+_SESSION = requests.Session()
+_SESSION.headers.update({'Accept-Encoding': 'gzip'})
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=10,
+    max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503]),
+))
+
+def _build_search_params(query, num_results, location):
+    """Build Custom Search API params, or None when credentials are missing."""
     api_key = os.getenv('GOOGLE_API_KEY')
     search_engine_id = os.getenv('GOOGLE_SEARCH_ENGINE_ID')
 
     if not api_key or not search_engine_id:
-        print("Warning: Google API key or Search Engine ID not found. Using fallback search.")
-        return fallback_search_results(query, num_results)
-
-    base_url = "https://www.googleapis.com/customsearch/v1"
+        return None
 
     # Enhance query with location for better job results
     enhanced_query = f"{query} {location}" if location and location.lower() not in query.lower() else query
 
-    params = {
+    return {
         'key': api_key,
         'cx': search_engine_id,
         'q': enhanced_query,
@@ -29,31 +55,40 @@ def search_google_with_api(query, num_results=10, location="United States"):
         'safe': 'off'
     }
 
-    try:
-        response = requests.get(base_url, params=params, timeout=10)
-        response.raise_for_status()
-        data = response.json()
+def _parse_search_items(data):
+    """Convert a Custom Search API response into result dicts."""
+    results = []
+
+    # Extract search results
+    if 'items' in data:
+        for item in data['items']:
+            results.append({
+                'title': item.get('title', ''),
+                'link': item.get('link', ''),
+                'snippet': item.get('snippet', ''),
+                'displayLink': item.get('displayLink', ''),
+                'position': len(results) + 1
+            })
 
-        results = []
+    return results
 
-        # Extract search results
-        if 'items' in data:
-            for item in data['items']:
-                results.append({
-                    'title': item.get('title', ''),
-                    'link': item.get('link', ''),
-                    'snippet': item.get('snippet', ''),
-                    'displayLink': item.get('displayLink', ''),
-                    'position': len(results) + 1
-                })
+def search_google_with_api(query, num_results=10, location="United States"):
+    """Search Google using Google Custom Search API for job-related content."""
+    params = _build_search_params(query, num_results, location)
+    if params is None:
+        logger.warning("Google API key or Search Engine ID not found. Using fallback search.")
+        return fallback_search_results(query, num_results)
 
-        return results
+    try:
+        response = _SESSION.get(SEARCH_API_URL, params=params, timeout=10)
+        response.raise_for_status()
+        return _parse_search_items(response.json())
 
     except requests.exceptions.RequestException as e:
-        print(f"Error during Google Search API request: {e}")
+        logger.warning("Error during Google Search API request: %s", e)
         return fallback_search_results(query, num_results)
     except Exception as e:
-        print(f"Unexpected error during search: {e}")
+        logger.warning("Unexpected error during search: %s", e)
         return fallback_search_results(query, num_results)
 
 def fallback_search_results(query, num_results):
@@ -81,76 +116,122 @@ def fallback_search_results(query, num_results):
     
     return fallback_results
 
-def search_multiple_queries(queries, num_results_per_query=10, location="United States"):
-    """Search multiple queries and combine results."""
-    all_results = []
+async def _async_search(session, semaphore, query, num_results, location):
+    """Search one query on a shared aiohttp session."""
+    params = _build_search_params(query, num_results, location)
+    if params is None:
+        logger.warning("Google API key or Search Engine ID not found. Using fallback search.")
+        return fallback_search_results(query, num_results)
 
-    for query in queries:
+    try:
+        async with semaphore:
+            async with session.get(SEARCH_API_URL, params=params,
+                                   timeout=aiohttp.ClientTimeout(total=10)) as response:
+                response.raise_for_status()
+                data = await response.json()
+        return _parse_search_items(data)
+    except Exception as e:
+        logger.warning("Error during Google Search API request: %s", e)
+        return fallback_search_results(query, num_results)
+
+async def _async_search_all(queries, num_results, location, max_concurrency):
+    """Run all queries on one session; gather keeps results in query order."""
+    semaphore = asyncio.Semaphore(max_concurrency)
+    connector = aiohttp.TCPConnector(limit=10)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        return await asyncio.gather(*[
+            _async_search(session, semaphore, query, num_results, location)
+            for query in queries
+        ])
+
+def _in_event_loop():
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+def search_multiple_queries(queries, num_results_per_query=10, location="United States", max_workers=6):
+    """Search multiple queries concurrently and combine results in query order.
+
+    Uses aiohttp when installed, otherwise a thread pool. max_workers bounds the
+    number of requests in flight either way.
+    """
+    if not queries:
+        return []
+
+    def run_query(query):
         try:
-            results = search_google_with_api(query, num_results_per_query, location)
-            all_results.extend(results)
-            # Rate limiting for API
-            time.sleep(0.1)
+            return search_google_with_api(query, num_results_per_query, location)
         except Exception as e:
-            print(f"Error searching query '{query}': {e}")
-            continue
+            logger.warning("Error searching query '%s': %s", query, e)
+            return []
+
+    # asyncio.run cannot nest inside a running loop, so fall back to threads there
+    if aiohttp is not None and not _in_event_loop():
+        results_per_query = asyncio.run(
+            _async_search_all(queries, num_results_per_query, location, max_workers)
+        )
+    else:
+        # Queries are independent and I/O-bound; max_workers also bounds the request rate
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(queries))) as executor:
+            results_per_query = list(executor.map(run_query, queries))
+
+    all_results = []
+    for results in results_per_query:
+        all_results.extend(results)
 
     return all_results
 
+# Job positions kept per search; extraction stops once this many are found
+MAX_JOB_POSITIONS = 20
+
 def extract_job_positions(search_results):
     """Extract and analyze job positions from Google Search results."""
-    job_positions = []
+    # dict keeps first-seen order while deduplicating
+    job_positions = {}
 
     for result in search_results:
-        title = result.get('title', '').lower()
-        snippet = result.get('snippet', '').lower()
-        combined_text = f"{title} {snippet}"
-
-        # Look for job-related keywords
-        job_keywords = [
-            'job', 'position', 'role', 'career', 'hiring', 'vacancy', 'opening',
-            'employment', 'work', 'opportunity', 'engineer', 'developer', 'analyst',
-            'manager', 'specialist', 'consultant', 'scientist', 'architect'
-        ]
+        combined_text = f"{result.get('title', '')} {result.get('snippet', '')}".lower()
 
         # Check if result contains job-related content
-        has_job_keywords = any(keyword in combined_text for keyword in job_keywords)
-
-        if has_job_keywords:
+        if any(category == 'job' for category, _ in match_keywords(combined_text)):
             # Extract potential job titles
-            extracted_titles = extract_job_titles_from_text(combined_text)
-            job_positions.extend(extracted_titles)
-
-    # Remove duplicates and return unique positions
-    unique_positions = list(set(job_positions))
-    return unique_positions[:20]  # Limit to top 20 positions
+            job_positions.update(dict.fromkeys(extract_job_titles_from_text(combined_text)))
+            if len(job_positions) >= MAX_JOB_POSITIONS:
+                break
+
+    return list(job_positions)[:MAX_JOB_POSITIONS]
+
+# Job title patterns, most specific first; compiled once at import
+JOB_TITLE_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in [
+    # Specific role patterns
+    r'\b(?:senior|junior|lead|principal|staff)?\s*(?:software|data|machine learning|ai|ml)\s+(?:engineer|scientist|developer)\b',
+    r'\b(?:frontend|backend|full.?stack|web)\s+developer\b',
+    r'\b(?:devops|cloud|security|network|systems)\s+engineer\b',
+    r'\b(?:product|project|engineering|data|marketing|sales)\s+manager\b',
+    r'\b(?:data|business|financial|systems|cybersecurity)\s+analyst\b',
+    r'\b(?:ux|ui|graphic|web)\s+designer\b',
+    r'\b(?:software|solution|enterprise|cloud)\s+architect\b',
+
+    # General patterns
+    r'\b\w+\s+(?:engineer|developer|analyst|manager|specialist|scientist|designer|architect|consultant)\b',
+    r'\b(?:engineer|developer|analyst|manager|specialist|scientist|designer|architect|consultant)\b',
+]]
+
+SALARY_RE = re.compile(r'\$[\d,]+(?:\s*-\s*\$[\d,]+)?')
 
 def extract_job_titles_from_text(text):
     """Extract job titles from text using advanced pattern matching."""
-    job_titles = []
-
-    # Enhanced job title patterns with regex
-    patterns = [
-        # Specific role patterns
-        r'\b(?:senior|junior|lead|principal|staff)?\s*(?:software|data|machine learning|ai|ml)\s+(?:engineer|scientist|developer)\b',
-        r'\b(?:frontend|backend|full.?stack|web)\s+developer\b',
-        r'\b(?:devops|cloud|security|network|systems)\s+engineer\b',
-        r'\b(?:product|project|engineering|data|marketing|sales)\s+manager\b',
-        r'\b(?:data|business|financial|systems|cybersecurity)\s+analyst\b',
-        r'\b(?:ux|ui|graphic|web)\s+designer\b',
-        r'\b(?:software|solution|enterprise|cloud)\s+architect\b',
-        
-        # General patterns
-        r'\b\w+\s+(?:engineer|developer|analyst|manager|specialist|scientist|designer|architect|consultant)\b',
-        r'\b(?:engineer|developer|analyst|manager|specialist|scientist|designer|architect|consultant)\b',
-    ]
+    # dict keeps match order with O(1) membership checks
+    job_titles = {}
 
-    for pattern in patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
+    for pattern in JOB_TITLE_PATTERNS:
+        matches = pattern.findall(text)
         for match in matches:
             clean_title = ' '.join(match.split()).title()
-            if len(clean_title) > 3 and clean_title not in job_titles:
-                job_titles.append(clean_title)
+            if len(clean_title) > 3:
+                job_titles.setdefault(clean_title)
 
     # Additional extraction for common job titles
     common_titles = [
@@ -161,11 +242,84 @@ def extract_job_titles_from_text(text):
         'Site Reliability Engineer', 'Platform Engineer', 'Quality Assurance Engineer'
     ]
 
+    text_lower = text.lower()
     for title in common_titles:
-        if title.lower() in text.lower() and title not in job_titles:
-            job_titles.append(title)
+        if title.lower() in text_lower:
+            job_titles.setdefault(title)
+
+    return list(job_titles)
+
+# Keyword sets scanned in every search result, by category
+KEYWORD_CATEGORIES = {
+    'job': [
+        'job', 'position', 'role', 'career', 'hiring', 'vacancy', 'opening',
+        'employment', 'work', 'opportunity', 'engineer', 'developer', 'analyst',
+        'manager', 'specialist', 'consultant', 'scientist', 'architect'
+    ],
+    'demand': ['high demand', 'growing field', 'increasing', 'expanding', 'hot job'],
+    'skill': [
+        'python', 'javascript', 'java', 'react', 'node.js', 'aws', 'docker',
+        'kubernetes', 'tensorflow', 'pytorch', 'sql', 'mongodb', 'redis',
+        'machine learning', 'ai', 'data science', 'cloud computing', 'devops'
+    ],
+    'remote': ['remote', 'work from home', 'distributed', 'anywhere', 'virtual'],
+}
+
+def _build_keyword_automaton():
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for category, keywords in KEYWORD_CATEGORIES.items():
+        for keyword in keywords:
+            automaton.add_word(keyword, (category, keyword))
+    automaton.make_automaton()
+    return automaton
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+def match_keywords(text):
+    """Return the set of (category, keyword) pairs found as substrings of lowercased text."""
+    if _KEYWORD_AUTOMATON is not None:
+        return {value for _, value in _KEYWORD_AUTOMATON.iter(text)}
+    return {
+        (category, keyword)
+        for category, keywords in KEYWORD_CATEGORIES.items()
+        for keyword in keywords
+        if keyword in text
+    }
 
-    return job_titles
+def analyze_search_results(search_results):
+    """Scan each search result once, bucketing keyword hits by category and collecting salaries."""
+    job_positions = {}
+    trend_score = 0
+    skill_mentions = {}
+    remote_count = 0
+    salaries = []
+
+    for result in search_results:
+        text = f"{result.get('title', '')} {result.get('snippet', '')}".lower()
+        categories = set()
+        for category, keyword in match_keywords(text):
+            categories.add(category)
+            if category == 'demand':
+                trend_score += 1
+            elif category == 'skill':
+                skill_mentions[keyword] = skill_mentions.get(keyword, 0) + 1
+
+        if 'job' in categories and len(job_positions) < MAX_JOB_POSITIONS:
+            job_positions.update(dict.fromkeys(extract_job_titles_from_text(text)))
+        if 'remote' in categories:
+            remote_count += 1
+        # Salary figures are unaffected by lowercasing
+        salaries.extend(SALARY_RE.findall(text))
+
+    return {
+        'job_positions': list(job_positions)[:MAX_JOB_POSITIONS],
+        'trend_score': trend_score,
+        'skill_mentions': skill_mentions,
+        'remote_count': remote_count,
+        'salaries': salaries
+    }
 
 def get_job_market_trends(domain, location="United States"):
     """Get comprehensive job market trends for a specific domain."""
@@ -179,12 +333,10 @@ def get_job_market_trends(domain, location="United States"):
         f"hiring {domain} professionals"
     ]
 
-    print(f"🔍 Searching job market trends for {domain}...")
+    logger.info("🔍 Searching job market trends for %s...", domain)
     search_results = search_multiple_queries(enhanced_queries, num_results_per_query=8, location=location)
-    job_positions = extract_job_positions(search_results)
-
-    # Analyze trends from search results
-    trend_analysis = analyze_market_trends(search_results, domain)
+    analysis = analyze_search_results(search_results)
+    job_positions = analysis['job_positions']
 
     return {
         'domain': domain,
@@ -193,24 +345,14 @@ def get_job_market_trends(domain, location="United States"):
         'job_positions': job_positions,
         'total_results': len(search_results),
         'unique_positions': len(job_positions),
-        'trending_skills': extract_trending_skills(search_results, domain),
-        'market_analysis': trend_analysis,
-        'salary_insights': extract_salary_insights(search_results),
-        'remote_opportunities': count_remote_opportunities(search_results)
+        'trending_skills': top_trending_skills(analysis['skill_mentions']),
+        'market_analysis': summarize_market_trends(analysis['trend_score']),
+        'salary_insights': summarize_salary_insights(analysis['salaries']),
+        'remote_opportunities': summarize_remote_opportunities(analysis['remote_count'], len(search_results))
     }
 
-def analyze_market_trends(search_results, domain):
-    """Analyze market trends from search results."""
-    demand_indicators = ['high demand', 'growing field', 'increasing', 'expanding', 'hot job']
-    skill_indicators = ['required skills', 'must have', 'essential', 'preferred']
-    
-    trend_score = 0
-    for result in search_results:
-        text = f"{result.get('title', '')} {result.get('snippet', '')}".lower()
-        for indicator in demand_indicators:
-            if indicator in text:
-                trend_score += 1
-    
+def summarize_market_trends(trend_score):
+    """Rate market demand from the number of demand indicators found."""
     if trend_score >= 5:
         market_demand = "Very High"
     elif trend_score >= 3:
@@ -226,51 +368,22 @@ def analyze_market_trends(search_results, domain):
         'growth_indicators': trend_score
     }
 
-def extract_trending_skills(search_results, domain):
-    """Extract trending skills from search results."""
-    tech_skills = [
-        'python', 'javascript', 'java', 'react', 'node.js', 'aws', 'docker', 
-        'kubernetes', 'tensorflow', 'pytorch', 'sql', 'mongodb', 'redis',
-        'machine learning', 'ai', 'data science', 'cloud computing', 'devops'
-    ]
-    
-    skill_mentions = {}
-    for result in search_results:
-        text = f"{result.get('title', '')} {result.get('snippet', '')}".lower()
-        for skill in tech_skills:
-            if skill in text:
-                skill_mentions[skill] = skill_mentions.get(skill, 0) + 1
-    
-    # Return top 10 trending skills
-    sorted_skills = sorted(skill_mentions.items(), key=lambda x: x[1], reverse=True)
+def top_trending_skills(skill_mentions):
+    """Return the most mentioned skills from a skill -> result count mapping."""
+    # Return top 10 trending skills, ties in keyword list order
+    skill_order = {skill: index for index, skill in enumerate(KEYWORD_CATEGORIES['skill'])}
+    sorted_skills = sorted(skill_mentions.items(), key=lambda x: (-x[1], skill_order.get(x[0], 0)))
     return [skill for skill, count in sorted_skills[:10]]
 
-def extract_salary_insights(search_results):
-    """Extract salary information from search results."""
-    salary_pattern = r'\$[\d,]+(?:\s*-\s*\$[\d,]+)?'
-    salaries = []
-    
-    for result in search_results:
-        text = f"{result.get('title', '')} {result.get('snippet', '')}"
-        salary_matches = re.findall(salary_pattern, text)
-        salaries.extend(salary_matches)
-    
+def summarize_salary_insights(salaries):
+    """Summarize the salary figures found in search results."""
     return {
         'salary_mentions': len(salaries),
         'sample_ranges': salaries[:5] if salaries else ['Data not available']
     }
 
-def count_remote_opportunities(search_results):
-    """Count remote work opportunities from search results."""
-    remote_keywords = ['remote', 'work from home', 'distributed', 'anywhere', 'virtual']
-    remote_count = 0
-    
-    for result in search_results:
-        text = f"{result.get('title', '')} {result.get('snippet', '')}".lower()
-        if any(keyword in text for keyword in remote_keywords):
-            remote_count += 1
-    
-    total_results = len(search_results)
+def summarize_remote_opportunities(remote_count, total_results):
+    """Summarize how many search results mention remote work."""
     remote_percentage = (remote_count / total_results * 100) if total_results > 0 else 0
     
     return {
@@ -1,19 +1,29 @@
 import io
+import logging
+
+logger = logging.getLogger(__name__)
 
 # Try to import PDF and DOCX libraries with fallbacks
+try:
+    import fitz  # PyMuPDF, much faster text extraction than PyPDF2
+except ImportError:
+    fitz = None
+
 try:
     import PyPDF2
-    PDF_AVAILABLE = True
 except ImportError:
-    PDF_AVAILABLE = False
-    print("PyPDF2 not available - PDF parsing disabled")
+    PyPDF2 = None
+
+PDF_AVAILABLE = fitz is not None or PyPDF2 is not None
+if not PDF_AVAILABLE:
+    logger.warning("PyMuPDF/PyPDF2 not available - PDF parsing disabled")
 
 try:
     import docx
     DOCX_AVAILABLE = True
 except ImportError:
     DOCX_AVAILABLE = False
-    print("python-docx not available - DOCX parsing disabled")
+    logger.warning("python-docx not available - DOCX parsing disabled")
 
 try:
     from .gemini_client import parse_resume_with_gemini
@@ -32,16 +42,19 @@ except ImportError:
 def extract_text_from_pdf(file):
     """Extract text from PDF file."""
     if not PDF_AVAILABLE:
-        return "PDF parsing not available - install PyPDF2"
+        return "PDF parsing not available - install pymupdf or PyPDF2"
     
     try:
-        pdf_reader = PyPDF2.PdfReader(file)
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text() + "\n"
-        return text.strip()
+        file.seek(0)
+        if fitz is not None:
+            with fitz.open(stream=file.read(), filetype='pdf') as doc:
+                parts = [page.get_text() for page in doc]
+        else:
+            pdf_reader = PyPDF2.PdfReader(file)
+            parts = [page.extract_text() for page in pdf_reader.pages]
+        return "\n".join(parts).strip()
     except Exception as e:
-        print(f"Error extracting text from PDF: {e}")
+        logger.warning("Error extracting text from PDF: %s", e)
         return ""
 
 def extract_text_from_docx(file):
@@ -50,13 +63,11 @@ def extract_text_from_docx(file):
         return "DOCX parsing not available - install python-docx"
     
     try:
+        file.seek(0)
         doc = docx.Document(file)
-        text = ""
-        for paragraph in doc.paragraphs:
-            text += paragraph.text + "\n"
-        return text.strip()
+        return "\n".join(paragraph.text for paragraph in doc.paragraphs).strip()
     except Exception as e:
-        print(f"Error extracting text from DOCX: {e}")
+        logger.warning("Error extracting text from DOCX: %s", e)
         return ""
 
 def extract_text_from_resume(uploaded_file):
@@ -76,22 +87,23 @@ def extract_text_from_resume(uploaded_file):
                 else:
                     return f.read().decode('utf-8', errors='ignore')
         except Exception as e:
-            print(f"Error reading file {uploaded_file}: {e}")
+            logger.warning("Error reading file %s: %s", uploaded_file, e)
             return ""
 
-    # Handle uploaded file objects (from web UI)
+    # Handle uploaded file objects (from web UI); read the upload exactly once
     try:
         file_type = uploaded_file.name.split('.')[-1].lower()
+        buffer = io.BytesIO(uploaded_file.read())
 
         if file_type == 'pdf':
-            return extract_text_from_pdf(io.BytesIO(uploaded_file.read()))
+            return extract_text_from_pdf(buffer)
         elif file_type in ['docx', 'doc']:
-            return extract_text_from_docx(io.BytesIO(uploaded_file.read()))
+            return extract_text_from_docx(buffer)
         else:
             # Assume it's text
-            return uploaded_file.read().decode('utf-8', errors='ignore')
+            return buffer.getvalue().decode('utf-8', errors='ignore')
     except Exception as e:
-        print(f"Error processing resume file: {e}")
+        logger.warning("Error processing resume file: %s", e)
         return ""
 
 def parse_resume(resume_text):
@@ -8,136 +8,59 @@ import google.generativeai as genai
 import json
 import time
 import os
+import re
+import copy
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from collections import Counter, OrderedDict
 from typing import List, Dict
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
-class CourseRecommender:
-    """Pure AI-powered 8-Step Learning Roadmap Generator"""
-
-    def __init__(self):
-        # Configure Gemini API
-        api_key = os.getenv('GEMINI_API_KEY')
-        if not api_key:
-            raise ValueError("❌ GEMINI_API_KEY not found in environment variables")
-        
-        genai.configure(api_key=api_key)
-        print("✅ Course Recommender initialized with pure AI generation")
-
-    def _generate_content(self, prompt: str) -> str:
-        """Generate content using Gemini with basic error handling"""
-        try:
-            model = genai.GenerativeModel('gemini-1.5-flash')
-            response = model.generate_content(prompt)
-            return response.text
-        except Exception as e:
-            raise Exception(f"AI generation failed: {str(e)}")
-
-    def _extract_json(self, text: str) -> dict:
-        """Extract and parse JSON from AI response with improved handling"""
-        # Clean markdown formatting
-        if text.startswith('```json'):
-            text = text[7:]
-        if text.startswith('```'):
-            text = text[3:]
-        if text.endswith('```'):
-            text = text[:-3]
-        
-        # Find JSON boundaries more precisely
-        text = text.strip()
-        
-        # Try to find the start and end of JSON object
-        start_idx = text.find('{')
-        if start_idx == -1:
-            raise Exception("No JSON object found in AI response")
-        
-        # Find the matching closing brace
-        brace_count = 0
-        end_idx = -1
-        for i in range(start_idx, len(text)):
-            if text[i] == '{':
-                brace_count += 1
-            elif text[i] == '}':
-                brace_count -= 1
-                if brace_count == 0:
-                    end_idx = i
-                    break
-        
-        if end_idx == -1:
-            raise Exception("Could not find complete JSON object in AI response")
-        
-        json_str = text[start_idx:end_idx + 1]
-        
-        try:
-            return json.loads(json_str)
-        except json.JSONDecodeError as e:
-            # If still fails, try a more aggressive approach
-            print(f"⚠️ JSON parsing failed, attempting cleanup...")
-            # Remove any potential trailing content after the JSON
-            lines = json_str.split('\n')
-            cleaned_lines = []
-            for line in lines:
-                # Stop at any line that looks like it's not part of JSON
-                if line.strip() and not any(char in line for char in '{}[]":,'):
-                    break
-                cleaned_lines.append(line)
-            
-            cleaned_json = '\n'.join(cleaned_lines)
-            try:
-                return json.loads(cleaned_json)
-            except json.JSONDecodeError:
-                raise Exception(f"Failed to parse AI response as JSON after cleanup: {str(e)}")
-
-    def _extract_json_list(self, text: str) -> list:
-        """Extract and parse JSON array from AI response"""
-        # Clean markdown formatting
-        if text.startswith('```json'):
-            text = text[7:]
-        if text.startswith('```'):
-            text = text[3:]
-        if text.endswith('```'):
-            text = text[:-3]
-        
-        # Find JSON array boundaries
-        text = text.strip()
-        
-        # Try to find the start and end of JSON array
-        start_idx = text.find('[')
-        if start_idx == -1:
-            raise Exception("No JSON array found in AI response")
-        
-        # Find the matching closing bracket
-        bracket_count = 0
-        end_idx = -1
-        for i in range(start_idx, len(text)):
-            if text[i] == '[':
-                bracket_count += 1
-            elif text[i] == ']':
-                bracket_count -= 1
-                if bracket_count == 0:
-                    end_idx = i
-                    break
-        
-        if end_idx == -1:
-            raise Exception("Could not find complete JSON array in AI response")
-        
-        json_str = text[start_idx:end_idx + 1]
-        
-        try:
-            return json.loads(json_str)
-        except json.JSONDecodeError as e:
-            raise Exception(f"Failed to parse AI response as JSON array: {str(e)}")
-
-    def generate_8_step_roadmap(self, subject: str, current_skills: str = "", goals: str = "") -> Dict:
-        """Generate 8-step learning roadmap using pure AI"""
-        print(f"🤖 Generating 8-step roadmap for: {subject}")
-        
-        prompt = f"""
+_JSON_DECODER = json.JSONDecoder()
+
+# Markdown code fence wrapping a whole response, e.g. ```json ... ```
+_FENCE_RE = re.compile(r'^\s*```(?:json)?\s*|\s*```\s*$', re.IGNORECASE)
+
+def _strip_fences(text: str) -> str:
+    """Remove a surrounding markdown code fence from an AI response"""
+    return _FENCE_RE.sub('', text).strip()
+
+class _RateLimiter:
+    """Token bucket: bursts of up to `rate` calls, refilled at `rate` per `period` seconds"""
+
+    def __init__(self, rate: int, period: float):
+        self.capacity = rate
+        self.tokens = float(rate)
+        self.fill_rate = rate / period
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token and return how long the caller must wait before using it"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.fill_rate)
+            self.updated = now
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.fill_rate
+
+    def wait(self):
+        delay = self._reserve()
+        if delay:
+            time.sleep(delay)
+
+# Shared by every CourseRecommender so concurrent plans respect one Gemini quota;
+# values below 1 are clamped to 1 request per minute (the bucket needs a positive rate)
+_GEMINI_LIMITER = _RateLimiter(max(1, int(os.getenv('GEMINI_REQUESTS_PER_MINUTE', '60'))), 60.0)
+
+# Prompt templates, filled with str.format_map (literal braces are doubled)
+_ROADMAP_PROMPT = """
         Create a comprehensive 8-step learning roadmap for: {subject}
-        Current skills: {current_skills or 'Beginner level'}
-        Goals: {goals or 'Master the subject professionally'}
+        Current skills: {current_skills}
+        Goals: {goals}
 
         Generate ONLY a valid JSON object with this exact structure:
         {{
@@ -239,25 +162,13 @@ class CourseRecommender:
         5. Return ONLY the JSON object, no additional text
         """
 
-        response = self._generate_content(prompt)
-        return self._extract_json(response)
-
-    def search_courses_for_step(self, step_data: Dict, subject: str) -> List[Dict]:
-        """Generate course recommendations for a specific step using AI"""
-        step_title = step_data.get('title', '')
-        skills = step_data.get('skills_to_learn', [])
-        topics = step_data.get('key_topics', [])
-        difficulty = step_data.get('difficulty_level', 'Intermediate')
-
-        print(f"🔍 AI searching courses for: {step_title}")
-
-        prompt = f"""
+_COURSES_PROMPT = """
         Find the best online courses for this learning step:
 
         Subject: {subject}
         Step: {step_title}
-        Skills to Learn: {', '.join(skills)}
-        Key Topics: {', '.join(topics)}
+        Skills to Learn: {skills_csv}
+        Key Topics: {topics_csv}
         Difficulty Level: {difficulty}
 
         Search for real courses from top educational platforms:
@@ -284,7 +195,7 @@ class CourseRecommender:
                 "instructor": "Real instructor name or institution",
                 "rating": "Realistic rating (4.0-5.0)/5",
                 "skills_gained": ["specific skill 1", "specific skill 2", "specific skill 3"],
-                "level": "{difficulty.lower()}",
+                "level": "{difficulty_lower}",
                 "enrollment_count": "Number of students enrolled"
             }}
         ]
@@ -299,25 +210,128 @@ class CourseRecommender:
         7. Return ONLY the JSON array, no additional text
         """
 
-        response = self._generate_content(prompt)
-        courses_data = self._extract_json_list(response)
+class CourseRecommender:
+    """Pure AI-powered 8-Step Learning Roadmap Generator"""
+
+    # Step course searches run concurrently, at most this many Gemini calls at once
+    MAX_CONCURRENT_REQUESTS = 4
+
+    def __init__(self):
+        # Configure Gemini API
+        api_key = os.getenv('GEMINI_API_KEY')
+        if not api_key:
+            raise ValueError("❌ GEMINI_API_KEY not found in environment variables")
+        
+        genai.configure(api_key=api_key)
+        self._model = genai.GenerativeModel('gemini-1.5-flash')
+        print("✅ Course Recommender initialized with pure AI generation")
+
+    def _generate_json(self, prompt: str, extract, closer: str):
+        """Stream a Gemini response and parse it with extract as soon as the JSON payload is complete
+
+        Parsing is attempted only when a chunk contains the closing character, and the
+        rest of the stream is not waited for once it succeeds.
+        """
+        parts = []
+        _GEMINI_LIMITER.wait()
+        try:
+            for chunk in self._model.generate_content(prompt, stream=True):
+                parts.append(chunk.text)
+                if closer in chunk.text:
+                    try:
+                        return extract(''.join(parts))
+                    except Exception:
+                        pass  # payload not complete yet
+        except Exception as e:
+            raise Exception(f"AI generation failed: {str(e)}")
+        return extract(''.join(parts))
+
+    def _extract_json(self, text: str) -> dict:
+        """Extract and parse JSON from AI response with improved handling"""
+        text = _strip_fences(text)
+        
+        # Decode from the first '{'; raw_decode stops at the end of the object and ignores trailing text
+        start_idx = text.find('{')
+        if start_idx == -1:
+            raise Exception("No JSON object found in AI response")
+        
+        try:
+            result, _ = _JSON_DECODER.raw_decode(text, start_idx)
+        except json.JSONDecodeError as e:
+            raise Exception(f"Failed to parse AI response as JSON: {str(e)}")
+        return result
+
+    def _extract_json_list(self, text: str) -> list:
+        """Extract and parse JSON array from AI response"""
+        text = _strip_fences(text)
+        
+        # Decode from the first '['; raw_decode stops at the end of the array and ignores trailing text
+        start_idx = text.find('[')
+        if start_idx == -1:
+            raise Exception("No JSON array found in AI response")
         
+        try:
+            result, _ = _JSON_DECODER.raw_decode(text, start_idx)
+        except json.JSONDecodeError as e:
+            raise Exception(f"Failed to parse AI response as JSON array: {str(e)}")
+        return result
+
+    def generate_8_step_roadmap(self, subject: str, current_skills: str = "", goals: str = "") -> Dict:
+        """Generate 8-step learning roadmap using pure AI"""
+        print(f"🤖 Generating 8-step roadmap for: {subject}")
+        
+        prompt = _ROADMAP_PROMPT.format_map({
+            'subject': subject,
+            'current_skills': current_skills or 'Beginner level',
+            'goals': goals or 'Master the subject professionally'
+        })
+
+        return self._generate_json(prompt, self._extract_json, '}')
+
+    def _courses_prompt(self, step_data: Dict, subject: str) -> str:
+        """Build the course search prompt for a roadmap step"""
+        step_title = step_data.get('title', '')
+        skills = step_data.get('skills_to_learn', [])
+        topics = step_data.get('key_topics', [])
+        difficulty = step_data.get('difficulty_level', 'Intermediate')
+
+        print(f"🔍 AI searching courses for: {step_title}")
+
+        return _COURSES_PROMPT.format_map({
+            'subject': subject,
+            'step_title': step_title,
+            'skills_csv': ', '.join(skills),
+            'topics_csv': ', '.join(topics),
+            'difficulty': difficulty,
+            'difficulty_lower': difficulty.lower()
+        })
+
+    def _enhance_step_courses(self, courses_data: List[Dict], step_data: Dict) -> List[Dict]:
+        """Validate the parsed course list for a step and add metadata"""
         if not isinstance(courses_data, list):
             raise Exception("AI did not return a list of courses")
 
-        # Enhance course data with metadata
-        enhanced_courses = []
+        # Enhance course data with metadata; the parsed dicts are ours, so update them in place
+        extras = {
+            'source': 'AI Generated',
+            'step_number': step_data.get('step_number'),
+            'search_date': time.strftime('%Y-%m-%d'),
+            'relevance_score': 0.9
+        }
         for course in courses_data:
-            enhanced_course = {
-                **course,
-                'source': 'AI Generated',
-                'step_number': step_data.get('step_number'),
-                'search_date': time.strftime('%Y-%m-%d'),
-                'relevance_score': 0.9
-            }
-            enhanced_courses.append(enhanced_course)
+            course.update(extras)
+
+        return courses_data
+
+    def search_courses_for_step(self, step_data: Dict, subject: str) -> List[Dict]:
+        """Generate course recommendations for a specific step using AI"""
+        courses_data = self._generate_json(self._courses_prompt(step_data, subject), self._extract_json_list, ']')
+        return self._enhance_step_courses(courses_data, step_data)
 
-        return enhanced_courses
+    def _search_all_steps(self, steps: List[Dict], subject: str) -> List[List[Dict]]:
+        """Search courses for every step concurrently, results in step order"""
+        with ThreadPoolExecutor(max_workers=self.MAX_CONCURRENT_REQUESTS) as pool:
+            return list(pool.map(lambda step: self.search_courses_for_step(step, subject), steps))
 
     def create_complete_learning_plan(self, subject: str, current_skills: str = "", goals: str = "") -> Dict:
         """Generate complete 8-step learning plan with AI-powered course recommendations"""
@@ -327,22 +341,30 @@ class CourseRecommender:
         roadmap = self.generate_8_step_roadmap(subject, current_skills, goals)
         print(f"✅ Generated {len(roadmap.get('steps', []))} learning steps")
 
-        # Step 2: Generate courses for each step
+        # Step 2: Generate courses for each step concurrently
+        steps = roadmap.get('steps', [])
+        courses_per_step = self._search_all_steps(steps, subject)
+
         all_courses = []
         courses_by_step = {}
 
-        for step in roadmap.get('steps', []):
-            step_courses = self.search_courses_for_step(step, subject)
+        for step, step_courses in zip(steps, courses_per_step):
             step_number = step.get('step_number')
             courses_by_step[f"step_{step_number}"] = step_courses
             all_courses.extend(step_courses)
-            time.sleep(1)  # Rate limiting
 
-        # Step 3: Categorize courses
-        free_courses = [c for c in all_courses if 'free' in c.get('price', '').lower()]
-        beginner_courses = [c for c in all_courses if c.get('level', '').lower() == 'beginner']
-        intermediate_courses = [c for c in all_courses if c.get('level', '').lower() == 'intermediate']
-        advanced_courses = [c for c in all_courses if c.get('level', '').lower() == 'advanced']
+        # Step 3: Categorize courses in a single pass
+        buckets = {'beginner': [], 'intermediate': [], 'advanced': [], 'free': []}
+        for course in all_courses:
+            level = course.get('level', '').lower()
+            if level in buckets and level != 'free':
+                buckets[level].append(course)
+            if 'free' in course.get('price', '').lower():
+                buckets['free'].append(course)
+        free_courses = buckets['free']
+        beginner_courses = buckets['beginner']
+        intermediate_courses = buckets['intermediate']
+        advanced_courses = buckets['advanced']
 
         # Step 4: Compile final result
         result = {
@@ -378,11 +400,71 @@ class CourseRecommender:
 
     def _analyze_platforms(self, courses: List[Dict]) -> Dict[str, int]:
         """Analyze platform distribution in courses"""
-        platform_count = {}
-        for course in courses:
-            platform = course.get('platform', 'Unknown')
-            platform_count[platform] = platform_count.get(platform, 0) + 1
-        return platform_count
+        return dict(Counter(course.get('platform', 'Unknown') for course in courses))
+
+# Learning plans keyed by normalized (interests, skills, goals); a repeat request skips all Gemini calls
+PLAN_CACHE_SIZE = 256
+_plan_cache = OrderedDict()
+_plan_cache_lock = threading.Lock()
+# Plans being generated right now: identical concurrent requests wait on the first one's Future
+_plan_inflight = {}
+
+def _plan_cache_key(interests: str, skills: str, goals: str) -> tuple:
+    return tuple(' '.join(value.split()).lower() for value in (interests, skills, goals))
+
+def _cached_plan(cache_key: tuple):
+    """Return a private copy of a cached plan, or None on a miss"""
+    with _plan_cache_lock:
+        cached = _plan_cache.get(cache_key)
+        if cached is None:
+            return None
+        _plan_cache.move_to_end(cache_key)
+    return copy.deepcopy(cached)
+
+def _generate_plan_once(cache_key: tuple, interests: str, skills: str, goals: str) -> Dict:
+    """Generate and cache a plan, or wait for the identical plan another request is generating
+
+    Only the request that created the Future generates and removes it; the others get
+    its result or exception.
+    """
+    with _plan_cache_lock:
+        cached = _plan_cache.get(cache_key)
+        future = _plan_inflight.get(cache_key)
+        leader = cached is None and future is None
+        if leader:
+            future = _plan_inflight[cache_key] = Future()
+    if cached is not None:
+        return copy.deepcopy(cached)
+    if not leader:
+        return copy.deepcopy(future.result())
+
+    try:
+        result = _get_recommender().create_complete_learning_plan(interests, skills, goals)
+        # Store a private copy so callers mutating the result cannot change the cached plan
+        stored = copy.deepcopy(result)
+        with _plan_cache_lock:
+            _plan_cache[cache_key] = stored
+            if len(_plan_cache) > PLAN_CACHE_SIZE:
+                _plan_cache.popitem(last=False)
+        future.set_result(stored)
+        return result
+    except Exception as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _plan_cache_lock:
+            _plan_inflight.pop(cache_key, None)
+
+# One recommender (and its configured Gemini model) is shared by all requests
+_recommender = None
+_recommender_lock = threading.Lock()
+
+def _get_recommender() -> CourseRecommender:
+    global _recommender
+    with _recommender_lock:
+        if _recommender is None:
+            _recommender = CourseRecommender()
+        return _recommender
 
 # Main API function for web compatibility
 def get_course_recommendations(interests: str, skills: str = "", goals: str = "") -> Dict:
@@ -398,8 +480,11 @@ def get_course_recommendations(interests: str, skills: str = "", goals: str = ""
         Dict: Complete AI-generated learning plan
     """
     try:
-        recommender = CourseRecommender()
-        result = recommender.create_complete_learning_plan(interests, skills, goals)
+        cache_key = _plan_cache_key(interests, skills, goals)
+        result = _cached_plan(cache_key)
+
+        if result is None:
+            result = _generate_plan_once(cache_key, interests, skills, goals)
         
         return {
             'success': True,
@@ -15,11 +15,21 @@ class AIResumeCore:
         self.api_key = api_key or os.getenv('GEMINI_API_KEY')
         if not self.api_key:
             raise ValueError("Gemini API key required")
+        # Generators hold a configured Gemini model; build one per template type and reuse it
+        self._generators = {}
+    
+    def _generator(self, template_type="tech"):
+        """Return the cached generator for a template type"""
+        generator = self._generators.get(template_type)
+        if generator is None:
+            generator = AIResumeGenerator(api_key=self.api_key, template_type=template_type)
+            self._generators[template_type] = generator
+        return generator
     
     def generate_resume(self, user_data, job_description="", template_type="tech"):
         """Generate AI-optimized resume"""
         try:
-            generator = AIResumeGenerator(api_key=self.api_key, template_type=template_type)
+            generator = self._generator(template_type)
             
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             pdf_path = generator.generate_resume(user_data, job_description, f"resume_{timestamp}")
@@ -46,13 +56,11 @@ class AIResumeCore:
     
     def optimize_for_job(self, user_data, job_description):
         """Optimize resume content for specific job"""
-        generator = AIResumeGenerator(api_key=self.api_key)
-        return generator.optimize_content(user_data, job_description)
+        return self._generator().optimize_content(user_data, job_description)
     
     def analyze_resume_strength(self, user_data):
         """Analyze resume strength and provide suggestions"""
-        generator = AIResumeGenerator(api_key=self.api_key)
-        return generator.analyze_resume(user_data)
+        return self._generator().analyze_resume(user_data)
 
 if __name__ == "__main__":
     # Example usage
@@ -15,9 +15,18 @@ sleep 2
 # Start in background and show both outputs
 echo "🔧 Starting backend and frontend..."
 
+# The backend only accepts browser requests from these UI origins (comma-separated).
+# Defaults to localhost plus this machine's LAN address on the Vite port, so the UI also
+# works from other devices on the network; set CORS_ORIGINS yourself to allow other hosts.
+LAN_IP=$(hostname -I 2>/dev/null | awk '{print $1}')
+export CORS_ORIGINS="${CORS_ORIGINS:-http://localhost:3000,http://127.0.0.1:3000${LAN_IP:+,http://$LAN_IP:3000}}"
+
 # Activate venv and start backend
 source venv/bin/activate && python run_app.py &
 
+# Start frontend dev server
+(cd web-ui && npm run dev) &
+
 echo "✅ Avaa-AI started!"
 echo "🌐 Check your browser - the app should open automatically"
 echo "⏹️  Press Ctrl+C to stop everything"
@@ -0,0 +1,27 @@
+"""
+Gunicorn configuration for serving run_app under gevent
+
+Launch with:
+    gunicorn -c gunicorn_conf.py run_app:app
+"""
+
+import os
+
+# The gevent worker monkey-patches the stdlib before run_app is imported,
+# so Flask-SocketIO has to run in the matching async mode.
+os.environ.setdefault('SOCKETIO_ASYNC_MODE', 'gevent')
+
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:8001')
+worker_class = 'geventwebsocket.gunicorn.workers.GeventWebSocketWorker'
+
+# Interview sessions and Socket.IO rooms live in process memory, so more than
+# one worker needs sticky sessions and a Socket.IO message queue in front.
+workers = int(os.getenv('GUNICORN_WORKERS', '1'))
+
+# Every endpoint mostly waits on Gemini/HTTP calls, so one worker can keep
+# many requests in flight as greenlets
+worker_connections = int(os.getenv('GUNICORN_WORKER_CONNECTIONS', '1000'))
+
+# Gemini calls for full learning plans and career reports can take a while
+timeout = int(os.getenv('GUNICORN_TIMEOUT', '120'))
+keepalive = 5
@@ -112,6 +112,12 @@ if [ ! -f ".env" ]; then
     exit 1
 fi
 
+# The backend only accepts browser requests from these UI origins (comma-separated).
+# Defaults to localhost plus this machine's LAN address on the Vite port, so the UI also
+# works from other devices on the network; set CORS_ORIGINS yourself to allow other hosts.
+LAN_IP=$(hostname -I 2>/dev/null | awk '{print $1}')
+export CORS_ORIGINS="${CORS_ORIGINS:-http://localhost:3000,http://127.0.0.1:3000${LAN_IP:+,http://$LAN_IP:3000}}"
+
 # Start backend
 print_status "Starting backend server..."
 nohup python3 run_app.py > logs/backend.log 2>&1 &
@@ -120,7 +126,10 @@ echo $BACKEND_PID > backend.pid
 
 # Wait for backend to start
 print_status "Waiting for backend to initialize..."
-sleep 5
+for _ in $(seq 1 150); do
+    curl -sf http://localhost:8001/api/health > /dev/null 2>&1 && break
+    sleep 0.1
+done
 
 # Start frontend
 print_status "Starting frontend server..."
@@ -4,136 +4,215 @@ Complete working integration of UI + AI
 """
 
 from flask import Flask, request, jsonify
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 from flask_socketio import SocketIO, emit, join_room, leave_room
 import os
 import sys
 from dotenv import load_dotenv
 import threading
-import subprocess
 import time
 import uuid
-import base64
+import functools
+import importlib
+import logging
+import logging.handlers
+import queue
+import atexit
 
-# Load environment variables
-load_dotenv()
-
-app = Flask(__name__)
-CORS(app, origins="*")
-socketio = SocketIO(app, cors_allowed_origins="*", async_mode='eventlet')
-
-# Add AI module paths correctly - each module in its own subdirectory
-current_dir = os.path.dirname(os.path.abspath(__file__))
-sys.path.insert(0, os.path.join(current_dir, 'ai-modules', 'career-guidance-ai'))
-sys.path.insert(0, os.path.join(current_dir, 'ai-modules', 'course-recommender'))
-sys.path.insert(0, os.path.join(current_dir, 'ai-modules', 'job-scraper'))
-sys.path.insert(0, os.path.join(current_dir, 'ai-modules', 'resume-generator'))
-sys.path.insert(0, os.path.join(current_dir, 'ai-modules', 'learning-roadmap'))
-
-print("🔧 Loading AI modules...")
-
-# Import modules with proper error handling
 try:
-    from ai_course_core import CourseRecommender, get_course_recommendations
-    print("✅ Course recommender loaded")
-except Exception as e:
-    print(f"❌ Course recommender error: {e}")
-    CourseRecommender = None
-    get_course_recommendations = None
+    import orjson
+except ImportError:
+    orjson = None
 
 try:
-    from ai_roadmap_core import AIRoadmapGenerator  
-    print("✅ Roadmap generator loaded")
-except Exception as e:
-    print(f"❌ Roadmap generator error: {e}")
-    AIRoadmapGenerator = None
+    # SIMD base64 decoding for clients that still send audio as text
+    import pybase64 as base64
+except ImportError:
+    import base64
 
-try:
-    from ai_job_scraper import AIJobScraper
-    print("✅ Job scraper loaded")
-except Exception as e:
-    print(f"❌ Job scraper error: {e}")
-    AIJobScraper = None
-
-# Import career guidance with forced reload
-AICareerGuidance = None
-try:
-    # Force reload by clearing any cached modules
-    if 'ai_career_guidance' in sys.modules:
-        del sys.modules['ai_career_guidance']
-    
-    from ai_career_guidance import AICareerGuidance
-    print("✅ Career guidance loaded")
-    
-    # Verify the function signature immediately after import
-    import inspect
-    sig = inspect.signature(AICareerGuidance().get_complete_analysis)
-    print(f"✅ Verified function signature: {sig}")
-    
-except Exception as e:
-    print(f"❌ Career guidance error: {e}")
-    AICareerGuidance = None
+# Load environment variables
+load_dotenv()
 
-try:
-    from ai_resume_core import AIResumeCore
-    print("✅ Resume generator loaded")
-except Exception as e:
-    print(f"❌ Resume generator error: {e}")
-    AIResumeCore = None
+# Per-request and per-chunk messages are logged at DEBUG so they cost nothing in production.
+# Records go through a queue to a listener thread, so handlers never block on stderr.
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler())
+logging.basicConfig(level=os.getenv('LOG_LEVEL', 'INFO').upper(), format="%(message)s",
+                    handlers=[logging.handlers.QueueHandler(_log_queue)])
+_log_listener.start()
+atexit.register(_log_listener.stop)
+logger = logging.getLogger(__name__)
 
-# Import AVA Voice Interview System
-try:
-    sys.path.insert(0, os.path.join(current_dir, 'ai-modules', 'AVA_voice'))
-    
-    # Set the correct API key for voice interview
-    os.environ["GOOGLE_API_KEY"] = os.getenv('GEMINI_API_KEY')
-    
-    from voice_final import OptimizedVoiceInterview
-    print("✅ AVA Voice Interview loaded")
-except Exception as e:
-    print(f"❌ AVA Voice Interview error: {e}")
-    OptimizedVoiceInterview = None
-
-# Import WebSocket Voice Interview Handler
-try:
-    from voice_interview_handler import WebSocketVoiceInterviewHandler
-    voice_handler = WebSocketVoiceInterviewHandler(socketio)
-    print("✅ WebSocket Voice Interview Handler loaded")
-except Exception as e:
-    print(f"❌ WebSocket Voice Interview Handler error: {e}")
-    voice_handler = None
+app = Flask(__name__)
+
+if orjson is not None:
+    class OrjsonProvider(DefaultJSONProvider):
+        """Serialize jsonify responses with orjson; large course and job payloads encode much faster"""
+
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj, default=self.default,
+                                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = OrjsonProvider(app)
+
+# Comma-separated list of UI origins allowed to call the API, e.g. to add a LAN
+# or production host: CORS_ORIGINS="http://localhost:3000,https://ui.example.com".
+# run.sh, start_app.sh and dev.sh add this machine's LAN address automatically.
+CORS_ORIGINS = [o.strip() for o in os.getenv(
+    'CORS_ORIGINS', 'http://localhost:3000,http://127.0.0.1:3000').split(',') if o.strip()]
+
+# max_age lets browsers cache the preflight for a day, so repeat JSON POSTs
+# from the UI skip the extra OPTIONS round trip
+CORS(app, origins=CORS_ORIGINS, methods=["GET", "POST"],
+     allow_headers=["Content-Type", "Authorization"], max_age=86400)
+socketio = SocketIO(app, cors_allowed_origins=CORS_ORIGINS, async_mode=os.getenv('SOCKETIO_ASYNC_MODE', 'eventlet'))
+
+# Blocking AI calls queued or running on the native thread pool. Once this many
+# are pending, new AI requests are refused with 503 instead of piling up.
+MAX_PENDING_AI_CALLS = int(os.getenv('MAX_PENDING_AI_CALLS', '64'))
+_pending_ai_calls = 0
+_pending_ai_calls_lock = threading.Lock()
+
+def _call_blocking(func, args, kwargs):
+    if socketio.async_mode == 'eventlet':
+        from eventlet import tpool
+        return tpool.execute(func, *args, **kwargs)
+    if socketio.async_mode == 'gevent':
+        import gevent
+        return gevent.get_hub().threadpool.apply(func, args, kwargs)
+    return func(*args, **kwargs)
+
+def run_blocking(func, *args, **kwargs):
+    """Run a blocking AI/SDK call on a native thread so it can't stall the event hub
+
+    HTTP routes and socket events share one cooperative hub, and the Gemini SDKs
+    block it (gRPC is not green-thread aware), so every long AI call goes through here.
+    """
+    global _pending_ai_calls
+    with _pending_ai_calls_lock:
+        _pending_ai_calls += 1
+    try:
+        return _call_blocking(func, args, kwargs)
+    finally:
+        with _pending_ai_calls_lock:
+            _pending_ai_calls -= 1
+
+def sheds_load(view):
+    """Refuse an AI route with 503 while the thread pool backlog is full"""
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        if _pending_ai_calls >= MAX_PENDING_AI_CALLS:
+            logger.warning("Shedding %s: %d AI calls pending", request.path, _pending_ai_calls)
+            response = jsonify({'success': False, 'error': 'Server is busy, please retry shortly'})
+            response.status_code = 503
+            response.headers['Retry-After'] = '5'
+            return response
+        return view(*args, **kwargs)
+    return wrapper
+
+# Add AI module paths correctly - each module in its own subdirectory.
+# Only directories that exist are added, once, so imports don't stat missing paths.
+current_dir = os.path.dirname(os.path.abspath(__file__))
+AI_MODULE_DIRS = ('AVA_voice', 'learning-roadmap', 'resume-generator', 'job-scraper', 'course-recommender', 'career-guidance-ai')
+sys.path[:0] = [
+    path for path in (os.path.join(current_dir, 'ai-modules', name) for name in AI_MODULE_DIRS)
+    if os.path.isdir(path) and path not in sys.path
+]
+
+# AI modules pull in heavy LLM/ML dependencies, so each one is imported on
+# first use by the route that needs it rather than at startup.
+
+# Capability name -> (module, attribute) loaded on first use
+AI_MODULES = {
+    'courses': ('ai_course_core', 'get_course_recommendations'),
+    'roadmap': ('ai_roadmap_core', 'AIRoadmapGenerator'),
+    'jobs': ('ai_job_scraper', 'AIJobScraper'),
+    'career': ('ai_career_guidance', 'AICareerGuidance'),
+    'resume': ('ai_resume_core', 'AIResumeCore'),
+    'voice': ('voice_interview_handler', 'WebSocketVoiceInterviewHandler'),
+}
+
+@functools.lru_cache(maxsize=None)
+def _get(module, attr):
+    """Import module on first use and return attr, or None if it can't be loaded"""
+    try:
+        value = getattr(importlib.import_module(module), attr)
+        logger.info("Loaded %s.%s", module, attr)
+        return value
+    except Exception as e:
+        logger.error("%s import error: %s", module, e)
+        return None
+
+# Module classes are built once per process and shared across requests
+_instances = {}
+_instances_lock = threading.Lock()
+
+def _instance(module, attr):
+    """Return the shared instance of a lazily imported class, or None if it can't be loaded"""
+    key = (module, attr)
+    with _instances_lock:
+        if key not in _instances:
+            cls = _get(module, attr)
+            _instances[key] = cls() if cls is not None else None
+        return _instances[key]
+
+_voice_handler = None
+_voice_handler_lock = threading.Lock()
+
+def get_voice_handler():
+    """Create the WebSocket voice interview handler on first use"""
+    global _voice_handler
+    with _voice_handler_lock:
+        if _voice_handler is None:
+            if os.getenv('GEMINI_API_KEY'):
+                # Set the correct API key for voice interview
+                os.environ["GOOGLE_API_KEY"] = os.getenv('GEMINI_API_KEY')
+
+            handler_cls = _get(*AI_MODULES['voice'])
+            if handler_cls is not None:
+                _voice_handler = handler_cls(socketio)
+        return _voice_handler
 
 @app.route('/api/health')
 def health():
-    return jsonify({'status': 'healthy', 'message': 'AI API running'})
+    # Report which AI modules this process has loaded without importing any
+    modules = {name: module in sys.modules for name, (module, _) in AI_MODULES.items()}
+    return jsonify({'status': 'healthy', 'message': 'AI API running', 'modules_loaded': modules})
 
 @app.route('/api/courses/recommend', methods=['POST'])
+@sheds_load
 def recommend_courses():
     try:
+        get_course_recommendations = _get(*AI_MODULES['courses'])
         if get_course_recommendations is None:
             return jsonify({'success': False, 'error': 'Course recommender module not available'}), 500
             
         data = request.get_json()
-        print(f"🎓 Generating course recommendations for: {data.get('interests', '')}")
+        logger.debug("Generating course recommendations for: %s", data.get('interests', ''))
         
         # Use the main API function from the course recommender
-        result = get_course_recommendations(
+        result = run_blocking(
+            get_course_recommendations,
             interests=data.get('interests', ''),
             skills=data.get('skills', ''),
             goals=data.get('goals', '')
         )
         
-        print(f"✅ Course recommendations generated: {result.get('success', False)}")
         if result.get('success'):
-            courses_count = len(result.get('data', {}).get('course_recommendations', []))
-            print(f"   🎓 Found {courses_count} courses")
+            logger.debug("Course recommendations generated: %d courses",
+                         len(result.get('data', {}).get('course_recommendations', [])))
             
         return jsonify(result)
     except Exception as e:
-        print(f"❌ Course recommendation error: {e}")
+        logger.error("Course recommendation error: %s", e)
         return jsonify({'success': False, 'error': str(e)}), 500
 
 @app.route('/api/roadmap/create', methods=['POST'])  
+@sheds_load
 def create_roadmap():
     try:
         data = request.get_json()
@@ -141,34 +220,34 @@ def create_roadmap():
         current_skills = data.get('currentSkills', '')
         goals = data.get('goals', '')
         
-        print(f"🎯 Creating integrated roadmap + courses for: {subject}")
+        logger.debug("Creating integrated roadmap + courses for: %s", subject)
         
         # Try to use the enhanced course recommender first
+        get_course_recommendations = _get(*AI_MODULES['courses'])
         if get_course_recommendations is not None:
-            print("✅ Using CourseRecommender for integrated roadmap+courses")
             
             # Use the course recommender which generates both roadmap and courses
-            result = get_course_recommendations(
+            result = run_blocking(
+                get_course_recommendations,
                 interests=subject,
                 skills=current_skills,
                 goals=goals
             )
             
             if result.get('success'):
-                print(f"✅ Integrated roadmap+courses generated successfully")
-                courses_count = len(result.get('data', {}).get('course_recommendations', []))
-                steps_count = len(result.get('data', {}).get('roadmap', {}).get('steps', []))
-                print(f"   📚 {steps_count} learning steps")
-                print(f"   🎓 {courses_count} courses with URLs")
+                logger.debug("Integrated roadmap generated: %d steps, %d courses",
+                             len(result.get('data', {}).get('roadmap', {}).get('steps', [])),
+                             len(result.get('data', {}).get('course_recommendations', [])))
                 return jsonify(result)
             else:
-                print("⚠️ Course recommender failed, falling back to basic roadmap")
+                logger.warning("Course recommender failed, falling back to basic roadmap")
         
         # Fallback to basic roadmap generator if course recommender fails
-        if AIRoadmapGenerator is not None:
-            print("⚠️ Using fallback AIRoadmapGenerator")
-            generator = AIRoadmapGenerator()
-            result = generator.create_complete_plan(
+        generator = _instance(*AI_MODULES['roadmap'])
+        if generator is not None:
+            logger.debug("Using fallback AIRoadmapGenerator")
+            result = run_blocking(
+                generator.create_complete_plan,
                 subject=subject,
                 current_skills=current_skills,
                 goals=goals
@@ -182,90 +261,83 @@ def create_roadmap():
         }), 500
         
     except Exception as e:
-        print(f"❌ Roadmap creation error: {e}")
-        import traceback
-        print(f"❌ Full traceback: {traceback.format_exc()}")
+        logger.exception("Roadmap creation error: %s", e)
         return jsonify({'success': False, 'error': str(e)}), 500
 
 @app.route('/api/jobs/search', methods=['POST'])
+@sheds_load
 def search_jobs():
     try:
-        if AIJobScraper is None:
+        scraper = _instance(*AI_MODULES['jobs'])
+        if scraper is None:
             return jsonify({'success': False, 'error': 'Job scraper module not available'}), 500
             
-        print("🔍 Job search request received")
         data = request.get_json()
-        print(f"📝 Request data: {data}")
+        logger.debug("Job search request: %s", data)
         
-        scraper = AIJobScraper()
-        result = scraper.search_jobs(
+        result = run_blocking(
+            scraper.search_jobs,
             query=data.get('query', ''),
             location=data.get('location', 'Remote')
         )
         
-        print(f"✅ Job search completed: Found {result.get('total_found', 0)} jobs")
+        logger.debug("Job search completed: found %s jobs", result.get('total_found', 0))
         return jsonify({'success': True, 'data': result})
         
     except Exception as e:
-        print(f"❌ Job search error: {e}")
+        logger.error("Job search error: %s", e)
         return jsonify({'success': False, 'error': str(e)}), 500
 
 @app.route('/api/career/analyze', methods=['POST'])
+@sheds_load
 def analyze_career():
     try:
         # Check if AICareerGuidance is available
-        if AICareerGuidance is None:
+        guidance = _instance(*AI_MODULES['career'])
+        if guidance is None:
             return jsonify({
                 'success': False, 
                 'error': 'Career guidance module is not available. Please check the server logs for import errors.'
             }), 500
         
         data = request.get_json()
-        print(f"📝 Received data: {data}")  # Debug log
-        
-        guidance = AICareerGuidance()
-        
-        # Debug: Check the function signature
-        import inspect
-        sig = inspect.signature(guidance.get_complete_analysis)
-        print(f"🔍 Function signature: {sig}")  # Debug log
+        logger.debug("Career analysis request: %s", data)
         
         # Only use domain interest and resume file - simplified inputs
-        print("🚀 Calling get_complete_analysis with simplified parameters...")
-        result = guidance.get_complete_analysis(
+        result = run_blocking(
+            guidance.get_complete_analysis,
             domain_interest=data.get('domainInterest', ''),
             resume_path=data.get('resumeFile')  # Handle resume file if provided
         )
-        print("✅ Career analysis completed successfully")
+        logger.debug("Career analysis completed")
         return jsonify({'success': True, 'data': result})
     except Exception as e:
-        print(f"❌ Career analysis error: {e}")
-        print(f"❌ Error type: {type(e)}")
-        import traceback
-        print(f"❌ Full traceback: {traceback.format_exc()}")
+        logger.exception("Career analysis error (%s): %s", type(e).__name__, e)
         return jsonify({'success': False, 'error': str(e)}), 500
 
 @app.route('/api/resume/generate', methods=['POST'])
+@sheds_load
 def generate_resume():
     try:
-        if AIResumeCore is None:
+        generator = _instance(*AI_MODULES['resume'])
+        if generator is None:
             return jsonify({'success': False, 'error': 'Resume generator module not available'}), 500
             
         data = request.get_json()
-        generator = AIResumeCore()
         
+        pi = data.get('personalInfo') or {}
         user_data = {
-            'full_name': data.get('personalInfo', {}).get('fullName', ''),
-            'email': data.get('personalInfo', {}).get('email', ''),
-            'phone': data.get('personalInfo', {}).get('phone', ''),
-            'location': data.get('personalInfo', {}).get('location', ''),
-            'summary': data.get('personalInfo', {}).get('summary', ''),
-            'experience': '\n'.join([f"{exp.get('position', '')} at {exp.get('company', '')}" for exp in data.get('experience', [])]),
-            'education': '\n'.join([f"{edu.get('degree', '')} - {edu.get('institution', '')}" for edu in data.get('education', [])]),
-            'skills': ', '.join(data.get('skills', []))
+            'full_name': pi.get('fullName', ''),
+            'email': pi.get('email', ''),
+            'phone': pi.get('phone', ''),
+            'location': pi.get('location', ''),
+            'summary': pi.get('summary', ''),
+            'experience': '\n'.join(f"{exp.get('position', '')} at {exp.get('company', '')}" for exp in data.get('experience') or ()),
+            'education': '\n'.join(f"{edu.get('degree', '')} - {edu.get('institution', '')}" for edu in data.get('education') or ()),
+            'skills': ', '.join(data.get('skills') or ())
         }
         
-        result = generator.generate_resume(user_data, data.get('jobDescription', ''))
+        result = run_blocking(generator.generate_resume, user_data, data.get('jobDescription', ''))
         return jsonify({'success': True, 'data': result})
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
@@ -276,8 +348,7 @@ def start_voice_interview():
         data = request.get_json()
         job_description = data.get('jobDescription', '')
         
-        print(f"🎙️ Voice interview request received")
-        print(f"📝 Job description length: {len(job_description)}")
+        logger.debug("Voice interview request, job description length: %d", len(job_description))
         
         # Simple response without trying to import the problematic module
         result = {
@@ -293,11 +364,10 @@ def start_voice_interview():
             }
         }
         
-        print("✅ Voice interview session prepared successfully")
         return jsonify({'success': True, 'data': result})
         
     except Exception as e:
-        print(f"❌ Voice interview error: {e}")
+        logger.error("Voice interview error: %s", e)
         return jsonify({'success': False, 'error': str(e)}), 500
 
 @app.route('/api/interview/voice/start', methods=['POST'])
@@ -315,43 +385,72 @@ def execute_voice_interview():
             'note': 'Voice interview runs in terminal for microphone access'
         }
         
-        print("✅ Voice interview execution instructions provided")
         return jsonify({'success': True, 'data': result})
         
     except Exception as e:
-        print(f"❌ Voice interview execution error: {e}")
+        logger.error("Voice interview execution error: %s", e)
         return jsonify({'success': False, 'error': str(e)}), 500
 
+# Constant error payloads, built once instead of on every event
+_HANDLER_UNAVAILABLE = {'message': 'Voice interview handler not available'}
+_SESSION_ID_REQUIRED = {'message': 'Session ID required'}
+_AUDIO_DATA_REQUIRED = {'message': 'Session ID and audio data required'}
+
+# Audio chunks are coalesced per session and handed to the voice handler in
+# batches, with one audio_batch_ack per flush instead of one ack per chunk.
+AUDIO_FLUSH_BYTES = 32 * 1024
+AUDIO_FLUSH_INTERVAL = 0.05  # seconds
+
+_audio_pending = {}  # session_id -> {'buffer', 'mime_type', 'acks', 'sid'}
+_audio_lock = threading.Lock()
+
+def _flush_audio(session_id):
+    """Hand buffered audio to the voice handler and ack the chunks it held"""
+    with _audio_lock:
+        pending = _audio_pending.pop(session_id, None)
+    if not pending:
+        return
+
+    get_voice_handler().process_audio_chunk(session_id, bytes(pending['buffer']), pending['mime_type'])
+    socketio.emit('audio_batch_ack', pending['acks'], to=pending['sid'])
+
+def _flush_audio_later(session_id):
+    socketio.sleep(AUDIO_FLUSH_INTERVAL)
+    _flush_audio(session_id)
+
 # ============================================================================
 # WebSocket Event Handlers for Live Voice Interview
 # ============================================================================
+# Handlers reply straight to the requesting client with emit(); only
+# server-initiated pushes address the session room.
 
 @socketio.on('connect')
 def handle_connect():
     """Handle client connection"""
-    print(f"✅ Client connected: {request.sid}")
+    logger.debug("Client connected: %s", request.sid)
     emit('connected', {'status': 'connected', 'sid': request.sid})
 
 @socketio.on('disconnect')
 def handle_disconnect():
     """Handle client disconnection"""
-    print(f"❌ Client disconnected: {request.sid}")
+    logger.debug("Client disconnected: %s", request.sid)
 
 @socketio.on('create_interview_session')
 def handle_create_session(data):
     """Create a new voice interview session"""
     try:
+        voice_handler = get_voice_handler()
         if voice_handler is None:
-            emit('error', {'message': 'Voice interview handler not available'})
+            emit('error', _HANDLER_UNAVAILABLE)
             return
 
-        session_id = str(uuid.uuid4())
+        session_id = uuid.uuid4().hex
         job_description = data.get('jobDescription', '')
         resume_path = data.get('resumePath', 'resume.pdf')
 
-        print(f"🎙️ Creating interview session: {session_id}")
+        logger.debug("Creating interview session: %s", session_id)
 
-        result = voice_handler.create_session(session_id, job_description, resume_path)
+        result = run_blocking(voice_handler.create_session, session_id, job_description, resume_path)
 
         if result['success']:
             join_room(session_id)
@@ -361,200 +460,233 @@ def handle_create_session(data):
                 'total_questions': result['total_questions'],
                 'fixed_questions': result['fixed_starter_questions']
             })
-            print(f"✅ Session created successfully: {session_id}")
+            logger.debug("Session created: %s", session_id)
         else:
             emit('error', {'message': result['error']})
-            print(f"❌ Failed to create session: {result['error']}")
+            logger.warning("Failed to create session: %s", result['error'])
 
     except Exception as e:
-        print(f"❌ Error creating session: {e}")
+        logger.error("Error creating session: %s", e)
         emit('error', {'message': str(e)})
 
 @socketio.on('get_next_question')
 def handle_get_question(data):
     """Get the next interview question"""
     try:
+        voice_handler = get_voice_handler()
         if voice_handler is None:
-            emit('error', {'message': 'Voice interview handler not available'})
+            emit('error', _HANDLER_UNAVAILABLE)
             return
 
         session_id = data.get('session_id')
         if not session_id:
-            emit('error', {'message': 'Session ID required'})
+            emit('error', _SESSION_ID_REQUIRED)
             return
 
-        print(f"📝 Getting next question for session: {session_id}")
+        logger.debug("Getting next question for session: %s", session_id)
 
-        result = voice_handler.get_next_question(session_id)
+        result = run_blocking(voice_handler.get_next_question, session_id)
 
         if result['success']:
-            emit('next_question', result, room=session_id)
-            print(f"✅ Question {result['question_number']} sent")
+            emit('next_question', result)
+            logger.debug("Question %s sent", result['question_number'])
         else:
-            emit('error', {'message': result['error'], 'completed': result.get('completed', False)}, room=session_id)
+            emit('error', {'message': result['error'], 'completed': result.get('completed', False)})
 
     except Exception as e:
-        print(f"❌ Error getting question: {e}")
+        logger.error("Error getting question: %s", e)
         emit('error', {'message': str(e)})
 
 @socketio.on('audio_chunk')
 def handle_audio_chunk(data):
     """Process incoming audio chunk"""
     try:
-        print(f"🎵 Received audio_chunk event")
+        voice_handler = get_voice_handler()
         if voice_handler is None:
-            emit('error', {'message': 'Voice interview handler not available'})
+            emit('error', _HANDLER_UNAVAILABLE)
             return
 
         session_id = data.get('session_id')
-        audio_b64 = data.get('audio_data')
+        audio_data = data.get('audio_data')
         mime_type = data.get('mime_type', 'audio/webm')  # Default to webm if not provided
 
-        print(f"🔑 Session ID: {session_id}")
-        print(f"📊 Audio data length: {len(audio_b64) if audio_b64 else 0}")
-        print(f"🎧 MIME type: {mime_type}")
+        logger.debug("audio_chunk session=%s len=%d mime=%s", session_id, len(audio_data) if audio_data else 0, mime_type)
 
-        if not session_id or not audio_b64:
-            emit('error', {'message': 'Session ID and audio data required'})
+        if not session_id or not audio_data:
+            emit('error', _AUDIO_DATA_REQUIRED)
             return
 
-        # Decode audio data
-        audio_bytes = base64.b64decode(audio_b64)
-
-        # Process audio chunk with MIME type
-        print(f"🎤 Processing audio chunk...")
-        voice_handler.process_audio_chunk(session_id, audio_bytes, mime_type)
-        print(f"✅ Audio chunk processed successfully")
-
-        # Acknowledge receipt
-        emit('audio_received', {'status': 'received'}, room=session_id)
+        # Binary frames arrive as bytes; older clients still send base64 strings
+        if isinstance(audio_data, (bytes, bytearray)):
+            audio_bytes = audio_data
+        else:
+            audio_bytes = base64.b64decode(audio_data)
+
+        # Coalesce into the session buffer; flush on size or after a short delay
+        with _audio_lock:
+            pending = _audio_pending.get(session_id)
+            schedule_flush = pending is None
+            if schedule_flush:
+                pending = _audio_pending[session_id] = {'buffer': bytearray(), 'mime_type': mime_type, 'acks': [], 'sid': request.sid}
+            pending['buffer'] += audio_bytes
+            pending['mime_type'] = mime_type
+            pending['acks'].append({'seq': data.get('seq', len(pending['acks'])), 'bytes_received': len(audio_bytes)})
+            flush_now = len(pending['buffer']) >= AUDIO_FLUSH_BYTES
+
+        if flush_now:
+            _flush_audio(session_id)
+        elif schedule_flush:
+            socketio.start_background_task(_flush_audio_later, session_id)
 
     except Exception as e:
-        print(f"❌ Error processing audio chunk: {e}")
+        logger.error("Error processing audio chunk: %s", e)
         emit('error', {'message': str(e)})
 
 @socketio.on('finish_recording')
 def handle_finish_recording(data):
     """Process complete audio recording"""
     try:
+        voice_handler = get_voice_handler()
         if voice_handler is None:
-            emit('error', {'message': 'Voice interview handler not available'})
+            emit('error', _HANDLER_UNAVAILABLE)
             return
 
         session_id = data.get('session_id')
         if not session_id:
-            emit('error', {'message': 'Session ID required'})
+            emit('error', _SESSION_ID_REQUIRED)
             return
 
-        print(f"🎤 Finishing recording for session: {session_id}")
+        logger.debug("Finishing recording for session: %s", session_id)
 
-        result = voice_handler.finish_recording(session_id)
+        # Make sure any coalesced audio reaches the handler first
+        _flush_audio(session_id)
+
+        result = run_blocking(voice_handler.finish_recording, session_id)
 
         if result['success']:
-            emit('recording_processed', result, room=session_id)
-            print(f"✅ Recording processed for question {result['question_number']}")
+            emit('recording_processed', result)
+            logger.debug("Recording processed for question %s", result['question_number'])
 
-            # Start polling for transcription
-            emit('transcription_started', {'question_number': result['question_number']}, room=session_id)
+            # Transcription is pushed to the room as transcription_ready when done
+            emit('transcription_started', {'question_number': result['question_number']})
+            socketio.start_background_task(voice_handler.push_transcription, session_id)
         else:
-            emit('error', {'message': result['error']}, room=session_id)
+            emit('error', {'message': result['error']})
 
     except Exception as e:
-        print(f"❌ Error finishing recording: {e}")
+        logger.error("Error finishing recording: %s", e)
         emit('error', {'message': str(e)})
 
 @socketio.on('get_transcription')
 def handle_get_transcription(data):
-    """Get transcription for the current answer"""
+    """Get transcription for the current answer (fallback; the server pushes transcription_ready)"""
     try:
+        voice_handler = get_voice_handler()
         if voice_handler is None:
-            emit('error', {'message': 'Voice interview handler not available'})
+            emit('error', _HANDLER_UNAVAILABLE)
             return
 
         session_id = data.get('session_id')
         if not session_id:
-            emit('error', {'message': 'Session ID required'})
+            emit('error', _SESSION_ID_REQUIRED)
             return
 
         result = voice_handler.get_transcription(session_id)
 
         if result['success']:
-            emit('transcription_ready', result, room=session_id)
-            print(f"✅ Transcription ready for question {result['question_number']}")
+            emit('transcription_ready', result)
+            logger.debug("Transcription ready for question %s", result['question_number'])
         else:
-            emit('transcription_pending', {'message': result['error']}, room=session_id)
+            emit('transcription_pending', {'message': result['error']})
 
     except Exception as e:
-        print(f"❌ Error getting transcription: {e}")
+        logger.error("Error getting transcription: %s", e)
         emit('error', {'message': str(e)})
 
 @socketio.on('get_session_status')
 def handle_get_status(data):
     """Get current session status"""
     try:
+        voice_handler = get_voice_handler()
         if voice_handler is None:
-            emit('error', {'message': 'Voice interview handler not available'})
+            emit('error', _HANDLER_UNAVAILABLE)
             return
 
         session_id = data.get('session_id')
         if not session_id:
-            emit('error', {'message': 'Session ID required'})
+            emit('error', _SESSION_ID_REQUIRED)
             return
 
         result = voice_handler.get_session_status(session_id)
 
         if result['success']:
-            emit('session_status', result, room=session_id)
+            emit('session_status', result)
         else:
             emit('error', {'message': result['error']})
 
     except Exception as e:
-        print(f"❌ Error getting session status: {e}")
+        logger.error("Error getting session status: %s", e)
         emit('error', {'message': str(e)})
 
+def _push_interview_report(voice_handler, session_id, sid):
+    """Build an ended interview's final report off the hub and send it to the client"""
+    try:
+        result = run_blocking(voice_handler.finalize_session, session_id)
+    except Exception as e:
+        logger.error("Error generating interview report: %s", e)
+        result = {'success': False, 'error': str(e)}
+
+    if result['success']:
+        socketio.emit('interview_completed', result, to=sid)
+        logger.debug("Interview completed: %s questions", result['total_questions_asked'])
+    else:
+        socketio.emit('error', {'message': result['error']}, to=sid)
+
 @socketio.on('end_interview')
 def handle_end_interview(data):
     """End the interview session"""
     try:
+        voice_handler = get_voice_handler()
         if voice_handler is None:
-            emit('error', {'message': 'Voice interview handler not available'})
+            emit('error', _HANDLER_UNAVAILABLE)
             return
 
         session_id = data.get('session_id')
         if not session_id:
-            emit('error', {'message': 'Session ID required'})
+            emit('error', _SESSION_ID_REQUIRED)
             return
 
-        print(f"🏁 Ending interview session: {session_id}")
+        logger.debug("Ending interview session: %s", session_id)
+
+        # Drop audio that was never finished so a late flush can't revive the session
+        with _audio_lock:
+            _audio_pending.pop(session_id, None)
 
         result = voice_handler.end_session(session_id)
 
         if result['success']:
-            emit('interview_completed', result, room=session_id)
+            # Answer right away; the report follows as interview_completed once Gemini is done
+            emit('interview_finalizing', result)
             leave_room(session_id)
-            print(f"✅ Interview completed: {result['total_questions_asked']} questions")
+            socketio.start_background_task(_push_interview_report, voice_handler, session_id, request.sid)
+            logger.debug("Interview ended: %s questions", result['total_questions_asked'])
         else:
             emit('error', {'message': result['error']})
 
     except Exception as e:
-        print(f"❌ Error ending interview: {e}")
+        logger.error("Error ending interview: %s", e)
         emit('error', {'message': str(e)})
 
-def start_frontend():
-    """Start the React frontend"""
-    time.sleep(3)  # Wait for API to start
-    print("🎨 Starting React frontend...")
-    os.chdir('web-ui')
-    subprocess.run(['npm', 'run', 'dev'])
-
 if __name__ == '__main__':
-    print("🚀 Starting Unified AI Tools")
-    print(f"🔑 Using API keys from .env")
-    
-    # Start frontend in separate thread
-    frontend_thread = threading.Thread(target=start_frontend)
-    frontend_thread.daemon = True
-    frontend_thread.start()
-    
-    print("📡 Starting API server with WebSocket support on http://localhost:8001")
+    logger.info("Starting Unified AI Tools")
+
+    if '--debug' in sys.argv:
+        # Import career guidance eagerly and verify its entry point
+        import inspect
+        AICareerGuidance = _get(*AI_MODULES['career'])
+        if AICareerGuidance is not None:
+            logger.info("Verified function signature: %s", inspect.signature(AICareerGuidance.get_complete_analysis))
+
+    # The React frontend runs as its own process: cd web-ui && npm run dev
+    logger.info("Starting API server with WebSocket support on http://localhost:8001")
     socketio.run(app, debug=False, host='0.0.0.0', port=8001)
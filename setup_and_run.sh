@@ -218,6 +218,12 @@ except ImportError:
     fi
 }
 
+# The backend only accepts browser requests from these UI origins (comma-separated).
+# Defaults to localhost plus this machine's LAN address on the Vite port, so the UI also
+# works from other devices on the network; set CORS_ORIGINS yourself to allow other hosts.
+LAN_IP=$(hostname -I 2>/dev/null | awk '{print $1}')
+export CORS_ORIGINS="${CORS_ORIGINS:-http://localhost:3000,http://127.0.0.1:3000${LAN_IP:+,http://$LAN_IP:3000}}"
+
 # Function to start the backend
 start_backend() {
     print_header "🚀 Starting Backend Server"
@@ -233,10 +239,13 @@ start_backend() {
     
     # Wait for backend to start
     print_status "Waiting for backend to start..."
-    sleep 5
+    for _ in $(seq 1 150); do
+        curl -sf http://localhost:8001/api/health > /dev/null 2>&1 && break
+        sleep 0.1
+    done
     
     # Check if backend is running
-    if curl -s http://localhost:8000/api/health > /dev/null 2>&1; then
+    if curl -sf http://localhost:8001/api/health > /dev/null 2>&1; then
         print_success "Backend server started successfully (PID: $BACKEND_PID)"
         echo $BACKEND_PID > backend.pid
     else
@@ -24,6 +24,12 @@ fi
 # Create logs directory
 mkdir -p logs
 
+# The backend only accepts browser requests from these UI origins (comma-separated).
+# Defaults to localhost plus this machine's LAN address on the Vite port, so the UI also
+# works from other devices on the network; set CORS_ORIGINS yourself to allow other hosts.
+LAN_IP=$(hostname -I 2>/dev/null | awk '{print $1}')
+export CORS_ORIGINS="${CORS_ORIGINS:-http://localhost:3000,http://127.0.0.1:3000${LAN_IP:+,http://$LAN_IP:3000}}"
+
 # Start backend
 echo -e "${BLUE}🔧 Starting backend server...${NC}"
 nohup python3 run_app.py > logs/backend.log 2>&1 &
@@ -142,6 +142,12 @@ echo "🎤 AVAA-AI VOICE INTERVIEW SYSTEM"
 echo "=================================="
 echo ""
 
+# The backend only accepts browser requests from these UI origins (comma-separated).
+# Defaults to localhost plus this machine's LAN address on the Vite port, so the UI also
+# works from other devices on the network; set CORS_ORIGINS yourself to allow other hosts.
+LAN_IP=$(hostname -I 2>/dev/null | awk '{print $1}')
+export CORS_ORIGINS="${CORS_ORIGINS:-http://localhost:3000,http://127.0.0.1:3000${LAN_IP:+,http://$LAN_IP:3000}}"
+
 # Function to start backend
 start_backend() {
     print_status "Starting Python backend server..."
@@ -155,7 +161,10 @@ BACKEND_PID=$!
 
 # Wait for backend to start
 print_status "Waiting for backend to initialize..."
-sleep 5
+for _ in $(seq 1 150); do
+    curl -sf http://localhost:8001/api/health > /dev/null 2>&1 && break
+    sleep 0.1
+done
 
 # Check if backend is still running
 if ! kill -0 $BACKEND_PID 2>/dev/null; then
@@ -165,10 +174,16 @@ fi
 
 print_success "Backend started successfully (PID: $BACKEND_PID)"
 
+# Start frontend dev server
+print_status "Starting React frontend..."
+(cd web-ui && npm run dev) &
+FRONTEND_PID=$!
+
 # Function to cleanup on exit
 cleanup() {
     print_status "Shutting down application..."
     kill $BACKEND_PID 2>/dev/null || true
+    kill $FRONTEND_PID 2>/dev/null || true
     pkill -f "python.*run_app.py" 2>/dev/null || true
     pkill -f "npm.*run.*dev" 2>/dev/null || true
     pkill -f "vite" 2>/dev/null || true
@@ -12,15 +12,80 @@ import base64
 import tempfile
 import wave
 import threading
+import time
+import queue
+import logging
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 
 # Add AI module paths
 current_dir = os.path.dirname(os.path.abspath(__file__))
-sys.path.insert(0, os.path.join(current_dir, 'ai-modules', 'AVA_voice'))
+voice_module_dir = os.path.join(current_dir, 'ai-modules', 'AVA_voice')
+if voice_module_dir not in sys.path:
+    sys.path.insert(0, voice_module_dir)
 
 from voice_final import OptimizedVoiceInterview
 
+logger = logging.getLogger(__name__)
+
+# How often the push task checks for a finished transcription, and how long it waits overall
+TRANSCRIPTION_POLL_INTERVAL = 0.25  # seconds
+TRANSCRIPTION_TIMEOUT = 120  # seconds
+
+# Sessions are split across this many dicts, each with its own lock, picked by session id hash
+SESSION_SHARDS = 16
+
+# Fallback questions once the resume's skills and projects are used up, asked in order
+BEHAVIORAL_QUESTIONS: Tuple[str, ...] = (
+    "Describe a time when you had to work under pressure. How did you handle it?",
+    "Tell me about a challenging technical problem you solved recently.",
+    "How do you stay updated with new technologies in your field?",
+    "Describe your approach to debugging complex issues.",
+    "Tell me about a time you disagreed with a team member. How did you resolve it?",
+    "What's your process for learning a new technology or framework?",
+    "Describe a project where you had to work with unclear requirements.",
+    "How do you ensure code quality in your projects?",
+    "Tell me about a time you had to explain a technical concept to a non-technical person.",
+    "What motivates you to work in this field?",
+    "How do you approach testing your code?",
+    "Describe a time when you had to optimize performance in an application.",
+)
+
+# Base64 of question audio keyed by question text. voice_final caches TTS audio per text,
+# so the same bytes object comes back for every interview and is encoded only once.
+AUDIO_B64_CACHE_SIZE = 64
+_audio_b64_cache = OrderedDict()
+_audio_b64_lock = threading.Lock()
+
+
+def _encode_question_audio(question_text: str, audio: bytes) -> str:
+    """Return base64 text for a question's audio, reusing the encoding of identical audio"""
+    with _audio_b64_lock:
+        cached = _audio_b64_cache.get(question_text)
+        if cached is not None and cached[0] is audio:
+            _audio_b64_cache.move_to_end(question_text)
+            return cached[1]
+
+    encoded = base64.b64encode(audio).decode('ascii')
+    with _audio_b64_lock:
+        _audio_b64_cache[question_text] = (audio, encoded)
+        if len(_audio_b64_cache) > AUDIO_B64_CACHE_SIZE:
+            _audio_b64_cache.popitem(last=False)
+    return encoded
+
+
+@dataclass
+class InterviewSession:
+    """Everything the handler keeps for one live interview"""
+    interview: OptimizedVoiceInterview
+    audio_buffer: bytearray = field(default_factory=bytearray)
+    mime_type: str = 'audio/webm'
+    # Resume skills/projects not yet asked about, in resume order
+    unused_skills: deque = field(default_factory=deque)
+    unused_projects: deque = field(default_factory=deque)
+
 
 class WebSocketVoiceInterviewHandler:
     """
@@ -29,9 +94,25 @@ class WebSocketVoiceInterviewHandler:
 
     def __init__(self, socketio):
         self.socketio = socketio
-        self.sessions = {}  # session_id -> interview_instance
-        self.audio_chunks = {}  # session_id -> audio_data_buffer
-        self.audio_mime_types = {}  # session_id -> mime_type
+        # Live sessions are spread over shards, each a dict with its own lock
+        self._session_shards: List[Dict[str, InterviewSession]] = [{} for _ in range(SESSION_SHARDS)]
+        self._session_locks = [threading.Lock() for _ in range(SESSION_SHARDS)]
+        # Ended interviews whose final report has not been generated yet
+        self.finishing: Dict[str, OptimizedVoiceInterview] = {}
+
+    def _shard_index(self, session_id: str) -> int:
+        return hash(session_id) % SESSION_SHARDS
+
+    def _shard_for(self, session_id: str) -> Dict[str, InterviewSession]:
+        """Return the dict holding a session"""
+        return self._session_shards[self._shard_index(session_id)]
+
+    def _lock_for(self, session_id: str) -> threading.Lock:
+        """Return the lock guarding a session's shard, buffers and counters"""
+        return self._session_locks[self._shard_index(session_id)]
+
+    def _get_session(self, session_id: str) -> Optional[InterviewSession]:
+        return self._shard_for(session_id).get(session_id)
 
     def create_session(self, session_id: str, job_description: str, resume_path: str = "resume.pdf"):
         """Initialize a new interview session"""
@@ -54,10 +135,17 @@ class WebSocketVoiceInterviewHandler:
             # Pre-load fixed starter questions
             interview.preload_fixed_starter_questions()
 
+            # Queue resume skills/projects once, deduplicated, for the dynamic questions
+            skills = filter(None, interview.resume_data.get('skills', []))
+            projects = filter(None, (p.get('name', '') for p in interview.resume_data.get('projects', [])))
+
             # Store session
-            self.sessions[session_id] = interview
-            self.audio_chunks[session_id] = []
-            self.audio_mime_types[session_id] = 'audio/webm'  # Default MIME type
+            with self._lock_for(session_id):
+                self._shard_for(session_id)[session_id] = InterviewSession(
+                    interview,
+                    unused_skills=deque(dict.fromkeys(skills)),
+                    unused_projects=deque(dict.fromkeys(projects)),
+                )
 
             return {
                 "success": True,
@@ -73,31 +161,26 @@ class WebSocketVoiceInterviewHandler:
 
     def get_next_question(self, session_id: str) -> Dict[str, Any]:
         """Get the next question for the session"""
-        print(f"🎯 Getting next question for session: {session_id}")
-
-        if session_id not in self.sessions:
-            print(f"❌ Session {session_id} not found")
+        session = self._get_session(session_id)
+        if session is None:
+            logger.warning("Session %s not found", session_id)
             return {"success": False, "error": "Session not found"}
 
-        interview = self.sessions[session_id]
+        interview = session.interview
 
         try:
-            print(f"📊 Current interview state: questions_asked={interview.questions_asked}, max={interview.max_questions}")
-
             # Check if we have more questions
             if interview.questions_asked >= interview.max_questions:
-                print(f"✅ Interview completed - no more questions")
+                logger.debug("Interview %s completed - no more questions", session_id)
                 return {"success": False, "error": "Interview completed", "completed": True}
 
             question_data = None
 
             # For first 3 questions, get from fixed starters
             if interview.questions_asked < 3:
-                print(f"📋 Getting fixed question #{interview.questions_asked + 1}")
                 try:
                     question_data = interview.audio_queue.get_nowait()
-                    print(f"✅ Retrieved question from audio queue")
-                except:
+                except queue.Empty:
                     # Fallback to fixed questions text
                     fixed_q = interview.fixed_starter_questions[interview.questions_asked]
                     question_data = {
@@ -107,10 +190,9 @@ class WebSocketVoiceInterviewHandler:
                         "source": "fixed_starter",
                         "order": fixed_q["order"]
                     }
-                    print(f"⚠️ Audio queue empty, using text fallback: {fixed_q['text'][:50]}...")
+                    logger.debug("Audio queue empty, using text fallback for question %d", interview.questions_asked + 1)
             else:
                 # For questions 4-15, generate dynamically
-                print(f"🔄 Generating dynamic question #{interview.questions_asked + 1}")
                 question_data = self._generate_dynamic_question(session_id)
 
             if question_data:
@@ -127,106 +209,66 @@ class WebSocketVoiceInterviewHandler:
 
                 # Add audio data if available
                 if question_data.get("audio"):
-                    result["audio_data"] = base64.b64encode(question_data["audio"]).decode('utf-8')
-                    print(f"✅ Question includes audio data")
-                else:
-                    print(f"ℹ️ Question is text-only")
+                    result["audio_data"] = _encode_question_audio(question_data["question"], question_data["audio"])
 
-                print(f"✅ Successfully prepared question {question_number}: {question_data['question'][:50]}...")
+                logger.debug("Prepared question %d (audio: %s)", question_number, result["has_audio"])
                 return result
             else:
-                print(f"❌ No question data generated")
+                logger.warning("No question data generated for session %s", session_id)
                 return {"success": False, "error": "Could not generate question"}
 
         except Exception as e:
-            print(f"❌ Error in get_next_question: {e}")
-            import traceback
-            print(f"🔍 Full error trace: {traceback.format_exc()}")
+            logger.exception("Error in get_next_question: %s", e)
             return {"success": False, "error": str(e)}
 
     def _generate_dynamic_question(self, session_id: str) -> Dict[str, Any]:
         """Generate a dynamic question for questions 4-15"""
         try:
-            print(f"🔄 Starting dynamic question generation for session {session_id}")
-
-            if session_id not in self.sessions:
+            session = self._get_session(session_id)
+            if session is None:
                 raise Exception(f"Session {session_id} not found")
 
-            interview = self.sessions[session_id]
-
-            print(f"📊 Session state: questions_asked={interview.questions_asked}, max_questions={interview.max_questions}")
-            print(f"📋 Resume data available: {bool(interview.resume_data)}")
-            print(f"🎯 Skills discussed: {len(interview.skills_discussed)}")
-            print(f"🗂️ Projects discussed: {len(interview.projects_discussed)}")
+            interview = session.interview
 
-            # Get unused resume elements for personalization
-            try:
-                unused_skills, unused_projects = interview.get_unused_resume_elements()
-                print(f"🔍 Found unused skills: {len(unused_skills)}, unused projects: {len(unused_projects)}")
-                if unused_skills:
-                    print(f"   Skills: {list(unused_skills)[:3]}")  # Show first 3
-                if unused_projects:
-                    print(f"   Projects: {list(unused_projects)[:3]}")  # Show first 3
-            except Exception as e:
-                print(f"⚠️ Error getting resume elements: {e}")
-                unused_skills, unused_projects = set(), set()
+            # Take the next resume skill/project nobody has asked about yet
+            while session.unused_skills and session.unused_skills[0] in interview.skills_discussed:
+                session.unused_skills.popleft()
+            while session.unused_projects and session.unused_projects[0] in interview.projects_discussed:
+                session.unused_projects.popleft()
 
             # Generate question based on current progress
             question_text = None
             question_type = "behavioral"  # default
 
-            if unused_skills and len(unused_skills) > 0:
-                skill = list(unused_skills)[0]  # Convert to list to get first item
+            if session.unused_skills:
+                skill = session.unused_skills.popleft()
                 question_text = f"Tell me about your experience with {skill} and how you've applied it in your projects."
                 interview.skills_discussed.add(skill)
                 question_type = "technical_skills"
-                print(f"✅ Generated skill-based question about: {skill}")
 
-            elif unused_projects and len(unused_projects) > 0:
-                project = list(unused_projects)[0]  # Convert to list to get first item
+            elif session.unused_projects:
+                project = session.unused_projects.popleft()
                 question_text = f"Can you walk me through your {project} project and the challenges you faced?"
                 interview.projects_discussed.add(project)
                 question_type = "projects_deep_dive"
-                print(f"✅ Generated project-based question about: {project}")
 
             else:
                 # Behavioral/situational questions as fallback
-                behavioral_questions = [
-                    "Describe a time when you had to work under pressure. How did you handle it?",
-                    "Tell me about a challenging technical problem you solved recently.",
-                    "How do you stay updated with new technologies in your field?",
-                    "Describe your approach to debugging complex issues.",
-                    "Tell me about a time you disagreed with a team member. How did you resolve it?",
-                    "What's your process for learning a new technology or framework?",
-                    "Describe a project where you had to work with unclear requirements.",
-                    "How do you ensure code quality in your projects?",
-                    "Tell me about a time you had to explain a technical concept to a non-technical person.",
-                    "What motivates you to work in this field?",
-                    "How do you approach testing your code?",
-                    "Describe a time when you had to optimize performance in an application."
-                ]
-
-                question_index = min(interview.questions_asked - 3, len(behavioral_questions) - 1)
-                question_text = behavioral_questions[question_index]
+                question_index = min(interview.questions_asked - 3, len(BEHAVIORAL_QUESTIONS) - 1)
+                question_text = BEHAVIORAL_QUESTIONS[question_index]
                 question_type = "behavioral"
-                print(f"✅ Generated behavioral question #{question_index + 1}")
 
             if not question_text:
                 raise Exception("Failed to generate question text")
 
-            print(f"📝 Generated question: {question_text[:50]}...")
+            logger.debug("Generated %s question: %.50s", question_type, question_text)
 
             # Try to generate TTS audio for the question (optional)
             audio_data = None
             try:
-                print(f"🎵 Attempting TTS audio generation...")
                 audio_data = interview.generate_tts_audio(question_text)
-                if audio_data:
-                    print(f"✅ TTS audio generated successfully")
-                else:
-                    print(f"ℹ️ No TTS audio - question will be text-only")
             except Exception as e:
-                print(f"⚠️ TTS generation error (continuing without audio): {e}")
+                logger.warning("TTS generation error (continuing without audio): %s", e)
                 audio_data = None
 
             result = {
@@ -236,17 +278,13 @@ class WebSocketVoiceInterviewHandler:
                 "source": "generated"
             }
 
-            print(f"✅ Dynamic question generation completed successfully")
             return result
 
         except Exception as e:
-            print(f"❌ Critical error in dynamic question generation: {e}")
-            import traceback
-            print(f"🔍 Full error trace: {traceback.format_exc()}")
+            logger.exception("Critical error in dynamic question generation: %s", e)
 
             # Return a safe fallback question to prevent the system from crashing
-            fallback_question = f"Tell me about a project you're proud of and what you learned from it."
-            print(f"🚨 Using fallback question: {fallback_question}")
+            fallback_question = "Tell me about a project you're proud of and what you learned from it."
 
             return {
                 "question": fallback_question,
@@ -257,44 +295,47 @@ class WebSocketVoiceInterviewHandler:
 
     def process_audio_chunk(self, session_id: str, audio_data: bytes, mime_type: str = 'audio/webm'):
         """Process incoming audio chunk from client"""
-        if session_id not in self.audio_chunks:
-            self.audio_chunks[session_id] = []
+        session = self._get_session(session_id)
+        if session is None:
+            return
 
-        # Store or update MIME type for this session
-        self.audio_mime_types[session_id] = mime_type
+        with self._lock_for(session_id):
+            # Store or update MIME type for this session
+            session.mime_type = mime_type
 
-        self.audio_chunks[session_id].append(audio_data)
+            # Grow one buffer in place instead of keeping a list of chunks to join later
+            session.audio_buffer += audio_data
 
     def finish_recording(self, session_id: str) -> Dict[str, Any]:
         """Process complete audio recording and get transcription"""
-        if session_id not in self.sessions:
+        session = self._get_session(session_id)
+        if session is None:
             return {"success": False, "error": "Session not found"}
 
-        if session_id not in self.audio_chunks or not self.audio_chunks[session_id]:
+        if not session.audio_buffer:
             return {"success": False, "error": "No audio data received"}
 
-        interview = self.sessions[session_id]
+        interview = session.interview
 
         try:
-            # Combine all audio chunks
-            combined_audio = b''.join(self.audio_chunks[session_id])
+            with self._lock_for(session_id):
+                # Take the recorded audio and clear the buffer for the next answer
+                combined_audio = bytes(session.audio_buffer)
+                session.audio_buffer.clear()
 
-            # Clear audio buffer
-            self.audio_chunks[session_id] = []
+                # Get current question info
+                question_number = interview.questions_asked + 1
+                current_question = "Current question"  # We'll track this properly
 
-            # Get current question info
-            question_number = interview.questions_asked + 1
-            current_question = "Current question"  # We'll track this properly
+                # Get MIME type for this session
+                mime_type = session.mime_type
 
-            # Get MIME type for this session
-            mime_type = self.audio_mime_types.get(session_id, 'audio/webm')
+                # Increment questions asked
+                interview.questions_asked += 1
 
             # Start transcription in background with MIME type
             interview.transcribe_in_background(combined_audio, question_number, current_question, mime_type)
 
-            # Increment questions asked
-            interview.questions_asked += 1
-
             return {
                 "success": True,
                 "message": "Audio processed, transcription in progress",
@@ -306,49 +347,85 @@ class WebSocketVoiceInterviewHandler:
 
     def get_transcription(self, session_id: str) -> Dict[str, Any]:
         """Get the latest transcription if available"""
-        if session_id not in self.sessions:
+        session = self._get_session(session_id)
+        if session is None:
             return {"success": False, "error": "Session not found"}
 
-        interview = self.sessions[session_id]
+        interview = session.interview
 
         try:
             # Check if transcription is ready
             transcription_data = interview.transcription_queue.get_nowait()
+        except queue.Empty:
+            return {"success": False, "error": "Transcription not ready"}
 
-            # Add to QA history
-            interview.qa_history.append(transcription_data)
-
-            return {
-                "success": True,
-                "transcription": transcription_data["answer"],
-                "question_number": transcription_data["question_number"],
-                "timestamp": transcription_data["timestamp"]
-            }
+        # Add to QA history
+        interview.qa_history.append(transcription_data)
 
-        except:
-            return {"success": False, "error": "Transcription not ready"}
+        return {
+            "success": True,
+            "transcription": transcription_data["answer"],
+            "question_number": transcription_data["question_number"],
+            "timestamp": transcription_data["timestamp"]
+        }
+
+    def push_transcription(self, session_id: str):
+        """Emit transcription_ready to the session room once the background transcription finishes
+
+        Run this as a Socket.IO background task after finish_recording succeeds.
+        """
+        waited = 0.0
+        while waited < TRANSCRIPTION_TIMEOUT and self._get_session(session_id) is not None:
+            result = self.get_transcription(session_id)
+            if result["success"]:
+                self.socketio.emit('transcription_ready', result, room=session_id)
+                return
+            self.socketio.sleep(TRANSCRIPTION_POLL_INTERVAL)
+            waited += TRANSCRIPTION_POLL_INTERVAL
+
+        logger.warning("No transcription pushed for session %s", session_id)
 
     def end_session(self, session_id: str) -> Dict[str, Any]:
-        """End the interview session and generate final report"""
-        if session_id not in self.sessions:
+        """End the interview session; the final report is built later by finalize_session"""
+        with self._lock_for(session_id):
+            session = self._shard_for(session_id).pop(session_id, None)
+        if session is None:
             return {"success": False, "error": "Session not found"}
 
-        interview = self.sessions[session_id]
+        interview = session.interview
+        self.finishing[session_id] = interview
+
+        return {
+            "success": True,
+            "status": "finalizing",
+            "total_questions_asked": len(interview.qa_history)
+        }
+
+    def finalize_session(self, session_id: str) -> Dict[str, Any]:
+        """Generate the final report for an ended session and save the interview"""
+        interview = self.finishing.pop(session_id, None)
+        if interview is None:
+            return {"success": False, "error": "Session not found"}
 
         try:
+            # The last answer may still be transcribing; every recorded answer puts exactly
+            # one entry (text or failure note) on the queue, so wait for the missing ones
+            deadline = time.monotonic() + TRANSCRIPTION_TIMEOUT
+            while len(interview.qa_history) < interview.questions_asked:
+                remaining = deadline - time.monotonic()
+                try:
+                    interview.qa_history.append(interview.transcription_queue.get(timeout=max(remaining, 0)))
+                except queue.Empty:
+                    logger.warning("Finalizing session %s without %d pending transcription(s)", session_id,
+                                   interview.questions_asked - len(interview.qa_history))
+                    break
+
             # Generate final evaluation report
             final_report = interview.generate_final_report()
 
             # Save interview to file
             saved_file = interview.save_interview_to_file()
 
-            # Clean up session
-            del self.sessions[session_id]
-            if session_id in self.audio_chunks:
-                del self.audio_chunks[session_id]
-            if session_id in self.audio_mime_types:
-                del self.audio_mime_types[session_id]
-
             return {
                 "success": True,
                 "final_report": final_report,
@@ -362,10 +439,11 @@ class WebSocketVoiceInterviewHandler:
 
     def get_session_status(self, session_id: str) -> Dict[str, Any]:
         """Get current status of the interview session"""
-        if session_id not in self.sessions:
+        session = self._get_session(session_id)
+        if session is None:
             return {"success": False, "error": "Session not found"}
 
-        interview = self.sessions[session_id]
+        interview = session.interview
 
         return {
             "success": True,
@@ -35,6 +35,7 @@ export const VoiceInterviewSession: React.FC<VoiceInterviewSessionProps> = ({
     sessionStatus,
     interviewReport,
     isCompleted,
+    isFinalizing,
     error,
     connect,
     createSession,
@@ -234,6 +235,14 @@ export const VoiceInterviewSession: React.FC<VoiceInterviewSessionProps> = ({
     );
   }
 
+  if (isFinalizing) {
+    return (
+      <Box sx={{ display: 'flex', justifyContent: 'center', alignItems: 'center', height: '400px' }}>
+        <Typography variant="h6">Interview finished - generating your report...</Typography>
+      </Box>
+    );
+  }
+
   if (isCompleted && interviewReport) {
     return (
       <Card sx={{ maxWidth: '800px', mx: 'auto', mt: 2 }}>
@@ -38,6 +38,7 @@ export interface UseVoiceInterviewState {
   // Completion state
   interviewReport: InterviewReport | null;
   isCompleted: boolean;
+  isFinalizing: boolean;
 
   // Error state
   error: string | null;
@@ -58,7 +59,7 @@ export interface UseVoiceInterviewActions {
   // Recording actions
   startRecording: () => Promise<void>;
   stopRecording: () => void;
-  sendAudioChunk: (audioData: string) => void;
+  sendAudioChunk: (audioData: ArrayBuffer | string) => void;
 
   // Transcription actions
   checkTranscription: () => void;
@@ -71,6 +72,9 @@ export interface UseVoiceInterviewActions {
   resetInterview: () => void;
 }
 
+// MediaRecorder emits a chunk this often (ms) so audio is uploaded during recording
+const RECORDING_TIMESLICE_MS = 1000;
+
 const initialState: UseVoiceInterviewState = {
   isConnected: false,
   isConnecting: false,
@@ -87,14 +91,13 @@ const initialState: UseVoiceInterviewState = {
   sessionStatus: null,
   interviewReport: null,
   isCompleted: false,
+  isFinalizing: false,
   error: null,
 };
 
 export const useVoiceInterview = (): UseVoiceInterviewState & UseVoiceInterviewActions => {
   const [state, setState] = useState<UseVoiceInterviewState>(initialState);
   const mediaRecorderRef = useRef<MediaRecorder | null>(null);
-  const audioChunksRef = useRef<Blob[]>([]);
-  const transcriptionPollingRef = useRef<number | null>(null);
   const sessionIdRef = useRef<string | null>(null); // Ref to store current session ID
   const audioMimeTypeRef = useRef<string>('audio/webm'); // Ref to store audio MIME type
 
@@ -158,12 +161,6 @@ export const useVoiceInterview = (): UseVoiceInterviewState & UseVoiceInterviewA
           transcriptionHistory: [...prev.transcriptionHistory, result],
           isTranscribing: false
         }));
-
-        // Clear polling
-        if (transcriptionPollingRef.current) {
-          clearInterval(transcriptionPollingRef.current);
-          transcriptionPollingRef.current = null;
-        }
       },
 
       onTranscriptionPending: () => {
@@ -174,11 +171,17 @@ export const useVoiceInterview = (): UseVoiceInterviewState & UseVoiceInterviewA
         setState(prev => ({ ...prev, sessionStatus: status }));
       },
 
+      onInterviewFinalizing: () => {
+        // The report arrives later as interview_completed
+        setState(prev => ({ ...prev, isFinalizing: true }));
+      },
+
       onInterviewCompleted: (report) => {
         setState(prev => ({
           ...prev,
           interviewReport: report,
-          isCompleted: true
+          isCompleted: true,
+          isFinalizing: false
         }));
       },
 
@@ -186,7 +189,8 @@ export const useVoiceInterview = (): UseVoiceInterviewState & UseVoiceInterviewA
         setState(prev => ({
           ...prev,
           error: error.message,
-          isCompleted: error.completed || false
+          isCompleted: error.completed || false,
+          isFinalizing: false
         }));
       },
     };
@@ -197,12 +201,6 @@ export const useVoiceInterview = (): UseVoiceInterviewState & UseVoiceInterviewA
   // Setup event handlers on hook initialization
   useEffect(() => {
     setupEventHandlers();
-
-    return () => {
-      if (transcriptionPollingRef.current) {
-        clearInterval(transcriptionPollingRef.current);
-      }
-    };
   }, []);
 
   // Connection actions
@@ -263,51 +261,45 @@ export const useVoiceInterview = (): UseVoiceInterviewState & UseVoiceInterviewA
       const stream = await navigator.mediaDevices.getUserMedia({ audio: true });
       console.log('✅ Microphone access granted');
 
-      audioChunksRef.current = [];
       const mimeType = MediaRecorder.isTypeSupported('audio/webm') ? 'audio/webm' : 'audio/mp4';
       audioMimeTypeRef.current = mimeType; // Store MIME type for later use
       console.log('🎧 Using MIME type:', mimeType);
 
       mediaRecorderRef.current = new MediaRecorder(stream, { mimeType });
 
+      // Upload audio while the candidate is still speaking; the server buffers it per session.
+      // Sends are chained so chunks reach the server in recording order.
+      let uploads = Promise.resolve();
+      let bytesRecorded = 0;
+
       mediaRecorderRef.current.ondataavailable = (event) => {
-        if (event.data.size > 0) {
-          audioChunksRef.current.push(event.data);
+        const currentSessionId = sessionIdRef.current;
+        if (event.data.size > 0 && currentSessionId) {
+          bytesRecorded += event.data.size;
+          const chunk = event.data;
+          // Sent as a binary Socket.IO attachment, no base64 round-trip
+          uploads = uploads.then(async () => {
+            voiceInterviewSocket.sendAudioChunk(currentSessionId, await chunk.arrayBuffer(), mimeType);
+          });
         }
       };
 
       mediaRecorderRef.current.onstop = async () => {
         console.log('🛑 Recording stopped, processing audio...');
-        console.log('📊 Audio chunks collected:', audioChunksRef.current.length);
-
-        const audioBlob = new Blob(audioChunksRef.current, { type: mimeType });
-        console.log('📦 Audio blob size:', audioBlob.size, 'bytes');
-
-        if (audioBlob.size === 0) {
-          console.error('❌ Audio blob is empty!');
-          setState(prev => ({ ...prev, error: 'No audio recorded. Please try again.' }));
-          return;
-        }
-
-        const arrayBuffer = await audioBlob.arrayBuffer();
-        const uint8Array = new Uint8Array(arrayBuffer);
-        const base64String = btoa(String.fromCharCode(...uint8Array));
-        console.log('🔐 Base64 string length:', base64String.length);
+        console.log('📦 Audio recorded:', bytesRecorded, 'bytes');
 
         // Use the ref value for immediate access (no closure issues)
         const currentSessionId = sessionIdRef.current;
         console.log('🔑 Session ID at processing time (ref):', currentSessionId);
 
-        if (currentSessionId) {
-          console.log('📡 Sending audio to server...');
-          console.log('🎧 Audio MIME type:', audioMimeTypeRef.current);
-          voiceInterviewSocket.sendAudioChunk(currentSessionId, base64String, audioMimeTypeRef.current);
+        if (bytesRecorded === 0) {
+          console.error('❌ No audio recorded!');
+          setState(prev => ({ ...prev, error: 'No audio recorded. Please try again.' }));
+        } else if (currentSessionId) {
+          // Everything but the final slice is already on the server
+          await uploads;
           voiceInterviewSocket.finishRecording(currentSessionId);
-
-          // Start polling for transcription
-          transcriptionPollingRef.current = setInterval(() => {
-            voiceInterviewSocket.getTranscription(currentSessionId);
-          }, 2000);
+          // The server pushes transcription_ready when the answer has been transcribed
 
           setState(prev => ({ ...prev, isProcessingAudio: true }));
         } else {
@@ -320,7 +312,7 @@ export const useVoiceInterview = (): UseVoiceInterviewState & UseVoiceInterviewA
         console.log('🔌 Audio stream cleaned up');
       };
 
-      mediaRecorderRef.current.start();
+      mediaRecorderRef.current.start(RECORDING_TIMESLICE_MS);
       setState(prev => ({ ...prev, isRecording: true, error: null }));
 
     } catch (error) {
@@ -338,7 +330,7 @@ export const useVoiceInterview = (): UseVoiceInterviewState & UseVoiceInterviewA
     }
   }, [state.isRecording]);
 
-  const sendAudioChunk = useCallback((audioData: string) => {
+  const sendAudioChunk = useCallback((audioData: ArrayBuffer | string) => {
     const currentSessionId = sessionIdRef.current;
     if (currentSessionId) {
       voiceInterviewSocket.sendAudioChunk(currentSessionId, audioData, audioMimeTypeRef.current);
@@ -368,10 +360,6 @@ export const useVoiceInterview = (): UseVoiceInterviewState & UseVoiceInterviewA
 
   const resetInterview = useCallback(() => {
     setState(initialState);
-    if (transcriptionPollingRef.current) {
-      clearInterval(transcriptionPollingRef.current);
-      transcriptionPollingRef.current = null;
-    }
   }, []);
 
   return {
@@ -61,6 +61,7 @@ export type VoiceInterviewEventHandlers = {
   onTranscriptionReady: (result: TranscriptionResult) => void;
   onTranscriptionPending: () => void;
   onSessionStatus: (status: SessionStatus) => void;
+  onInterviewFinalizing: (data: { total_questions_asked: number }) => void;
   onInterviewCompleted: (report: InterviewReport) => void;
   onError: (error: { message: string; completed?: boolean }) => void;
 };
@@ -111,7 +112,7 @@ class VoiceInterviewSocketService {
           this.handlers.onNextQuestion?.(question);
         });
 
-        this.socket.on('audio_received', () => {
+        this.socket.on('audio_batch_ack', () => {
           this.handlers.onAudioReceived?.();
         });
 
@@ -138,6 +139,11 @@ class VoiceInterviewSocketService {
           this.handlers.onSessionStatus?.(status);
         });
 
+        this.socket.on('interview_finalizing', (data: { total_questions_asked: number }) => {
+          console.log('🏁 Interview ended, generating report...');
+          this.handlers.onInterviewFinalizing?.(data);
+        });
+
         this.socket.on('interview_completed', (report: InterviewReport) => {
           console.log('🏁 Interview completed!');
           this.handlers.onInterviewCompleted?.(report);
@@ -177,7 +183,7 @@ class VoiceInterviewSocketService {
     this.socket.emit('get_next_question', { session_id: sessionId });
   }
 
-  sendAudioChunk(sessionId: string, audioData: string, mimeType?: string): void {
+  sendAudioChunk(sessionId: string, audioData: ArrayBuffer | string, mimeType?: string): void {
     if (!this.socket) throw new Error('Socket not connected');
 
     this.socket.emit('audio_chunk', {